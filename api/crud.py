@@ -5,10 +5,12 @@ Database operations for routes, schedules, seat occupancy, and analytics.
 Includes business logic for pricing suggestions and data quality reporting.
 """
 
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func, and_, or_, desc, asc
-from typing import List, Optional, Dict, Any
-from datetime import datetime, timedelta
+from sqlalchemy.orm import Session
+from sqlalchemy import func, and_, or_, desc, asc, select, update, lambda_stmt, bindparam
+from cachetools import TTLCache
+from dataclasses import dataclass
+from typing import List, Optional, Dict, Any, Tuple
+from datetime import datetime, timedelta, date, timezone
 import logging
 
 import models
@@ -17,64 +19,264 @@ import schemas
 logger = logging.getLogger(__name__)
 
 
+def utcnow() -> datetime:
+    """Naive UTC timestamp without the deprecated datetime.utcnow() call
+
+    Kept naive to match the timestamps already stored by the models and
+    accepted from clients.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+# Quantize helpers for hot response paths; module-level bindings avoid the
+# repeated global builtin lookup that inline round(x, k) calls pay
+def _q1(x: float) -> float:
+    return round(x, 1)
+
+
+def _q2(x: float) -> float:
+    return round(x, 2)
+
+
+def _q3(x: float) -> float:
+    return round(x, 3)
+
+
+@dataclass(frozen=True)
+class RouteLite:
+    """Session-independent route snapshot safe to cache across requests"""
+    route_id: int
+    distance_km: float
+
+
+# Routes are essentially static, so a short TTL cache saves one DB
+# round-trip per pricing request
+_route_cache = TTLCache(maxsize=4096, ttl=300)
+
+
 def get_route(db: Session, route_id: int) -> Optional[models.Route]:
     """Get a single route by ID"""
     return db.query(models.Route).filter(models.Route.route_id == route_id).first()
 
 
+def get_route_cached(db: Session, route_id: int) -> Optional[RouteLite]:
+    """Get a cached, session-independent view of a route
+
+    ORM objects are bound to their session and cannot be cached safely, so
+    the cache holds RouteLite snapshots instead.
+    """
+    cached = _route_cache.get(route_id)
+    if cached is not None:
+        return cached
+
+    route = get_route(db, route_id)
+    if route is None:
+        return None
+
+    route_lite = RouteLite(route_id=route.route_id,
+                           distance_km=route.distance_km)
+    _route_cache[route_id] = route_lite
+    return route_lite
+
+
 def get_routes(db: Session, skip: int = 0, limit: int = 100) -> List[models.Route]:
     """Get all routes with pagination"""
-    return db.query(models.Route).offset(skip).limit(limit).all()
+    # lambda_stmt caches statement construction and compilation by lambda
+    # identity, so repeated calls only bind new parameter values
+    stmt = lambda_stmt(
+        lambda: select(models.Route)
+        .offset(bindparam("skip"))
+        .limit(bindparam("lim"))
+    )
+    return db.execute(stmt, {"skip": skip, "lim": limit}).scalars().all()
 
 
 def get_operators(db: Session, skip: int = 0, limit: int = 100) -> List[models.Operator]:
     """Get all operators with pagination"""
-    return db.query(models.Operator).filter(models.Operator.is_active == True).offset(skip).limit(limit).all()
+    stmt = lambda_stmt(
+        lambda: select(models.Operator)
+        .where(models.Operator.is_active == True)
+        .offset(bindparam("skip"))
+        .limit(bindparam("lim"))
+    )
+    return db.execute(stmt, {"skip": skip, "lim": limit}).scalars().all()
 
 
 def get_schedules_by_route_and_date(
     db: Session,
     route_id: int,
-    date: str,
+    target_date: date,
     skip: int = 0,
     limit: int = 100
-) -> List[models.Schedule]:
-    """Get schedules for a specific route and date"""
-    target_date = datetime.strptime(date, '%Y-%m-%d').date()
-    return (
-        db.query(models.Schedule)
-        .options(joinedload(models.Schedule.route), joinedload(models.Schedule.operator))
-        .filter(
+) -> Tuple[List[schemas.ScheduleDict], int]:
+    """Get schedules for a specific route and date, plus the unpaginated total
+
+    Takes an already-parsed date so the endpoint validates/parses exactly
+    once. The total comes from a COUNT(*) OVER() window on the same query,
+    so paginating consumers get it without a second round trip. Selects
+    column tuples rather than mapped entities, so no ORM instances are
+    hydrated on this read-only path. Returns (schedule_dicts, total_count).
+    """
+    # Half-open range keeps the date filter sargable (index-friendly);
+    # wrapping the column in func.date() would force a full scan.
+    # Recommended index: CREATE INDEX idx_schedule_route_date ON schedules (route_id, date)
+    start = datetime.combine(target_date, datetime.min.time())
+    next_date = start + timedelta(days=1)
+    stmt = lambda_stmt(
+        lambda: select(
+            models.Schedule.schedule_id,
+            models.Schedule.route_id,
+            models.Schedule.operator_id,
+            models.Schedule.departure_time,
+            models.Schedule.arrival_time,
+            models.Schedule.date,
+            models.Schedule.is_active,
+            models.Route.origin,
+            models.Route.destination,
+            models.Route.distance_km,
+            models.Route.created_at.label("route_created_at"),
+            models.Operator.name.label("operator_name"),
+            models.Operator.contact_email,
+            models.Operator.contact_phone,
+            models.Operator.is_active.label("operator_is_active"),
+            models.Operator.created_at.label("operator_created_at"),
+            func.count().over().label("total_count")
+        )
+        .join(models.Route,
+              models.Schedule.route_id == models.Route.route_id)
+        .join(models.Operator,
+              models.Schedule.operator_id == models.Operator.operator_id)
+        .where(
             and_(
-                models.Schedule.route_id == route_id,
-                func.date(models.Schedule.date) == target_date,
+                models.Schedule.route_id == bindparam("rid"),
+                models.Schedule.date >= bindparam("d0"),
+                models.Schedule.date < bindparam("d1"),
                 models.Schedule.is_active == True
             )
         )
-        .offset(skip)
-        .limit(limit)
-        .all()
+        .offset(bindparam("skip"))
+        .limit(bindparam("lim"))
     )
+    rows = db.execute(
+        stmt,
+        {"rid": route_id, "d0": start, "d1": next_date,
+         "skip": skip, "lim": limit}
+    ).all()
+    if not rows:
+        # COUNT(*) OVER() only exists on returned rows, so an offset
+        # past the last match would otherwise report a total of 0 to
+        # paginating clients; a real count is cheap and only runs on
+        # this overshoot path
+        total = db.execute(
+            select(func.count())
+            .select_from(models.Schedule)
+            .join(models.Route,
+                  models.Schedule.route_id == models.Route.route_id)
+            .join(models.Operator,
+                  models.Schedule.operator_id == models.Operator.operator_id)
+            .where(
+                and_(
+                    models.Schedule.route_id == route_id,
+                    models.Schedule.date >= start,
+                    models.Schedule.date < next_date,
+                    models.Schedule.is_active == True
+                )
+            )
+        ).scalar() or 0
+        return [], total
+
+    schedules = [
+        {
+            "schedule_id": row.schedule_id,
+            "route_id": row.route_id,
+            "operator_id": row.operator_id,
+            "departure_time": row.departure_time,
+            "arrival_time": row.arrival_time,
+            "date": row.date,
+            "is_active": row.is_active,
+            "route": {
+                "route_id": row.route_id,
+                "origin": row.origin,
+                "destination": row.destination,
+                "distance_km": row.distance_km,
+                "created_at": row.route_created_at,
+            },
+            "operator": {
+                "operator_id": row.operator_id,
+                "name": row.operator_name,
+                "contact_email": row.contact_email,
+                "contact_phone": row.contact_phone,
+                "is_active": row.operator_is_active,
+                "created_at": row.operator_created_at,
+            },
+        }
+        for row in rows
+    ]
+    return schedules, rows[0].total_count
 
 
 def get_schedule_with_occupancy(db: Session, schedule_id: int) -> Optional[models.Schedule]:
     """Get a schedule with its seat occupancy data"""
     return (
         db.query(models.Schedule)
-        .options(
-            joinedload(models.Schedule.route),
-            joinedload(models.Schedule.operator),
-            joinedload(models.Schedule.seat_occupancy)
-        )
         .filter(models.Schedule.schedule_id == schedule_id)
         .first()
     )
 
 
+def schedule_occupancy_response(schedule: models.Schedule) -> schemas.ScheduleWithOccupancy:
+    """Materialize a ScheduleWithOccupancy schema from a loaded ORM schedule
+
+    Uses model_construct throughout: the values come straight from the
+    database, so re-running field validators on every nested route,
+    operator, and occupancy record would only burn CPU. Incoming HTTP
+    bodies keep full validation.
+    """
+    route = schedule.route
+    operator = schedule.operator
+    return schemas.ScheduleWithOccupancy.model_construct(
+        schedule_id=schedule.schedule_id,
+        route_id=schedule.route_id,
+        operator_id=schedule.operator_id,
+        departure_time=schedule.departure_time,
+        arrival_time=schedule.arrival_time,
+        date=schedule.date,
+        is_active=schedule.is_active,
+        route=schemas.RouteResponse.model_construct(
+            route_id=route.route_id,
+            origin=route.origin,
+            destination=route.destination,
+            distance_km=route.distance_km,
+            created_at=route.created_at
+        ) if route else None,
+        operator=schemas.OperatorResponse.model_construct(
+            operator_id=operator.operator_id,
+            name=operator.name,
+            contact_email=operator.contact_email,
+            contact_phone=operator.contact_phone,
+            is_active=operator.is_active,
+            created_at=operator.created_at
+        ) if operator else None,
+        seat_occupancy=[
+            schemas.SeatOccupancyResponse.model_construct(
+                id=occupancy.id,
+                schedule_id=occupancy.schedule_id,
+                seat_type=occupancy.seat_type,
+                total_seats=occupancy.total_seats,
+                occupied_seats=occupancy.occupied_seats,
+                fare=occupancy.fare,
+                occupancy_rate=occupancy.occupancy_rate,
+                timestamp=occupancy.timestamp
+            )
+            for occupancy in schedule.seat_occupancy
+        ]
+    )
+
+
 def get_occupancy_stats(
     db: Session,
     route_id: Optional[int] = None,
-    date: Optional[str] = None,
+    target_date: Optional[date] = None,
     seat_type: Optional[str] = None
 ) -> schemas.OccupancyStats:
     """Calculate occupancy statistics with optional filters"""
@@ -87,9 +289,10 @@ def get_occupancy_stats(
     if route_id:
         filters.append(models.Schedule.route_id == route_id)
 
-    if date:
-        target_date = datetime.strptime(date, '%Y-%m-%d').date()
-        filters.append(func.date(models.Schedule.date) == target_date)
+    if target_date:
+        start = datetime.combine(target_date, datetime.min.time())
+        filters.append(models.Schedule.date >= start)
+        filters.append(models.Schedule.date < start + timedelta(days=1))
 
     if seat_type:
         filters.append(models.SeatOccupancy.seat_type == seat_type)
@@ -97,14 +300,31 @@ def get_occupancy_stats(
     if filters:
         query = query.filter(and_(*filters))
 
-    # Calculate statistics
-    occupancy_records = query.all()
-
-    if not occupancy_records:
-        return schemas.OccupancyStats(
+    # Calculate all statistics in a single aggregate query instead of
+    # hydrating every matching row into Python objects
+    occupancy_rate = func.coalesce(models.SeatOccupancy.occupancy_rate, 0)
+    (
+        unique_schedules,
+        avg_occupancy, min_occupancy, max_occupancy,
+        avg_fare, min_fare, max_fare,
+        total_seats, occupied_seats
+    ) = query.with_entities(
+        func.count(func.distinct(models.SeatOccupancy.schedule_id)),
+        func.avg(occupancy_rate),
+        func.min(occupancy_rate),
+        func.max(occupancy_rate),
+        func.avg(models.SeatOccupancy.fare),
+        func.min(models.SeatOccupancy.fare),
+        func.max(models.SeatOccupancy.fare),
+        func.sum(models.SeatOccupancy.total_seats),
+        func.sum(models.SeatOccupancy.occupied_seats)
+    ).one()
+
+    if not unique_schedules:
+        return schemas.OccupancyStats.model_construct(
             route_id=route_id,
             seat_type=seat_type,
-            date_range=date or "all dates",
+            date_range=target_date.isoformat() if target_date else "all dates",
             total_schedules=0,
             average_occupancy_rate=0,
             min_occupancy_rate=0,
@@ -116,34 +336,170 @@ def get_occupancy_stats(
             total_seats_occupied=0
         )
 
-    # Calculate metrics
-    occupancy_rates = [
-        record.occupancy_rate or 0 for record in occupancy_records]
-    fares = [record.fare for record in occupancy_records]
-    total_seats = sum(record.total_seats for record in occupancy_records)
-    occupied_seats = sum(record.occupied_seats for record in occupancy_records)
-
-    # Get unique schedule count
-    unique_schedules = len(
-        set(record.schedule_id for record in occupancy_records))
-
-    return schemas.OccupancyStats(
+    return schemas.OccupancyStats.model_construct(
         route_id=route_id,
         seat_type=seat_type,
-        date_range=date or "all dates",
+        date_range=target_date.isoformat() if target_date else "all dates",
         total_schedules=unique_schedules,
-        average_occupancy_rate=round(
-            sum(occupancy_rates) / len(occupancy_rates), 3),
-        min_occupancy_rate=round(min(occupancy_rates), 3),
-        max_occupancy_rate=round(max(occupancy_rates), 3),
-        average_fare=round(sum(fares) / len(fares), 2),
-        min_fare=round(min(fares), 2),
-        max_fare=round(max(fares), 2),
+        average_occupancy_rate=_q3(avg_occupancy),
+        min_occupancy_rate=_q3(min_occupancy),
+        max_occupancy_rate=_q3(max_occupancy),
+        average_fare=_q2(avg_fare),
+        min_fare=_q2(min_fare),
+        max_fare=_q2(max_fare),
         total_seats_available=total_seats,
         total_seats_occupied=occupied_seats
     )
 
 
+def get_occupancy_stats_batch(
+    db: Session,
+    route_ids: List[int],
+    target_date: Optional[date] = None,
+    seat_type: Optional[str] = None
+) -> List[schemas.OccupancyStats]:
+    """Calculate per-route occupancy statistics for several routes at once
+
+    One GROUP BY query replaces the N single-route aggregates a caller
+    would otherwise issue; results come back in route_ids order, with
+    zeroed stats for routes that have no occupancy data.
+    """
+    occupancy_rate = func.coalesce(models.SeatOccupancy.occupancy_rate, 0)
+
+    query = db.query(
+        models.Schedule.route_id,
+        func.count(func.distinct(models.SeatOccupancy.schedule_id)),
+        func.avg(occupancy_rate),
+        func.min(occupancy_rate),
+        func.max(occupancy_rate),
+        func.avg(models.SeatOccupancy.fare),
+        func.min(models.SeatOccupancy.fare),
+        func.max(models.SeatOccupancy.fare),
+        func.sum(models.SeatOccupancy.total_seats),
+        func.sum(models.SeatOccupancy.occupied_seats)
+    ).select_from(models.SeatOccupancy).join(models.Schedule)
+
+    filters = [models.Schedule.route_id.in_(route_ids)]
+
+    if target_date:
+        start = datetime.combine(target_date, datetime.min.time())
+        filters.append(models.Schedule.date >= start)
+        filters.append(models.Schedule.date < start + timedelta(days=1))
+
+    if seat_type:
+        filters.append(models.SeatOccupancy.seat_type == seat_type)
+
+    rows = {
+        row[0]: row
+        for row in query.filter(and_(*filters))
+        .group_by(models.Schedule.route_id).all()
+    }
+
+    date_range = target_date.isoformat() if target_date else "all dates"
+    results = []
+    for route_id in route_ids:
+        row = rows.get(route_id)
+        if row is None:
+            results.append(schemas.OccupancyStats.model_construct(
+                route_id=route_id,
+                seat_type=seat_type,
+                date_range=date_range,
+                total_schedules=0,
+                average_occupancy_rate=0,
+                min_occupancy_rate=0,
+                max_occupancy_rate=0,
+                average_fare=0,
+                min_fare=0,
+                max_fare=0,
+                total_seats_available=0,
+                total_seats_occupied=0
+            ))
+            continue
+
+        (_, unique_schedules,
+         avg_occupancy, min_occupancy, max_occupancy,
+         avg_fare, min_fare, max_fare,
+         total_seats, occupied_seats) = row
+        results.append(schemas.OccupancyStats.model_construct(
+            route_id=route_id,
+            seat_type=seat_type,
+            date_range=date_range,
+            total_schedules=unique_schedules,
+            average_occupancy_rate=_q3(avg_occupancy),
+            min_occupancy_rate=_q3(min_occupancy),
+            max_occupancy_rate=_q3(max_occupancy),
+            average_fare=_q2(avg_fare),
+            min_fare=_q2(min_fare),
+            max_fare=_q2(max_fare),
+            total_seats_available=total_seats,
+            total_seats_occupied=occupied_seats
+        ))
+
+    return results
+
+
+# Hour buckets for the pricing heuristic, hoisted to module level so the
+# hot path does no per-call list construction
+PEAK_HOURS = frozenset((7, 8, 9, 17, 18, 19))
+OFF_PEAK_HOURS = frozenset((22, 23, 0, 1, 2, 3, 4, 5))
+
+# Precomputed per-hour time adjustment so the kernel does a single O(1)
+# table lookup instead of two membership scans
+_HOUR_FACTOR = [1.0] * 24
+for _hour in PEAK_HOURS:
+    _HOUR_FACTOR[_hour] = 1.15
+for _hour in OFF_PEAK_HOURS:
+    _HOUR_FACTOR[_hour] = 0.9
+
+
+def _pricing_kernel(
+    base_fare: float,
+    occupancy_rate: float,
+    departure_hour: int,
+    time_to_departure_hours: float,
+    long_distance_sleeper: bool
+) -> tuple:
+    """Pure scalar core of the pricing heuristic
+
+    Branch-free of any ORM or request objects so it stays cheap on the hot
+    path. Takes departure_hour=-1 when no departure time is known. Returns
+    (suggested_fare, fare_adjustment_percentage, occupancy_adjustment,
+    time_adjustment, demand_adjustment).
+    """
+    occupancy_adjustment = 1.0
+    time_adjustment = 1.0
+    demand_adjustment = 1.0
+
+    if occupancy_rate > 0.8:
+        occupancy_adjustment = 1.0 + \
+            (occupancy_rate - 0.8) * 2.5  # Up to 50% increase
+    elif occupancy_rate < 0.3:
+        occupancy_adjustment = 1.0 - \
+            (0.3 - occupancy_rate) * 0.67  # Up to 20% decrease
+
+    if departure_hour >= 0:
+        time_adjustment = _HOUR_FACTOR[departure_hour]
+
+        if time_to_departure_hours < 2:  # Less than 2 hours
+            demand_adjustment = 1.2
+        elif time_to_departure_hours > 24 * 7:  # More than a week
+            demand_adjustment = 0.95
+
+    if long_distance_sleeper:
+        demand_adjustment *= 1.1
+
+    suggested_fare = base_fare * occupancy_adjustment * \
+        time_adjustment * demand_adjustment
+
+    # Apply bounds (10% below to 100% above base fare)
+    suggested_fare = max(base_fare * 0.9, min(suggested_fare, base_fare * 2.0))
+    fare_adjustment_percentage = (
+        (suggested_fare - base_fare) / base_fare) * 100
+
+    return (suggested_fare, fare_adjustment_percentage,
+            occupancy_adjustment, time_adjustment, demand_adjustment)
+
+
 def calculate_pricing_suggestion(
     db: Session,
     pricing_request: schemas.PricingRequest
@@ -158,118 +514,123 @@ def calculate_pricing_suggestion(
     - Route distance affects base pricing
     """
 
-    # Get route information
-    route = get_route(db, pricing_request.route_id)
+    # Get route information (cached; only distance_km is needed here)
+    route = get_route_cached(db, pricing_request.route_id)
     if not route:
         raise ValueError(f"Route {pricing_request.route_id} not found")
 
-    # Get historical pricing data for this route and seat type
-    historical_data = (
-        db.query(models.SeatOccupancy)
+    # Aggregate historical pricing data for this route and seat type in SQL
+    # instead of hydrating up to 50 ORM objects just to average one column
+    recent_fares = (
+        db.query(models.SeatOccupancy.fare)
         .join(models.Schedule)
         .filter(
             and_(
                 models.Schedule.route_id == pricing_request.route_id,
-                models.SeatOccupancy.seat_type == pricing_request.seat_type.value
+                models.SeatOccupancy.seat_type == pricing_request.seat_type
             )
         )
         .order_by(desc(models.SeatOccupancy.timestamp))
         .limit(50)  # Last 50 records
-        .all()
+        .subquery()
+    )
+    historical_avg_fare, historical_count = (
+        db.query(func.avg(recent_fares.c.fare), func.count()).one()
     )
 
     # Calculate base fare from historical data or use provided current fare
     if pricing_request.current_fare:
         base_fare = pricing_request.current_fare
-    elif historical_data:
-        base_fare = sum(
-            record.fare for record in historical_data) / len(historical_data)
+    elif historical_count:
+        base_fare = historical_avg_fare
     else:
         # Fallback: calculate based on distance and seat type
         rate_per_km = 2.5 if pricing_request.seat_type == schemas.SeatType.REGULAR else 3.5
         base_fare = route.distance_km * rate_per_km
 
-    # Initialize adjustment factors
-    occupancy_adjustment = 1.0
-    time_adjustment = 1.0
-    demand_adjustment = 1.0
     confidence_score = 0.8
     reasoning_parts = []
 
-    # Occupancy-based adjustment
+    # Gather the scalar inputs for the pricing kernel
     occupancy_rate = pricing_request.current_occupancy_rate
+    if pricing_request.departure_time:
+        departure_hour = pricing_request.departure_time.hour
+        time_to_departure = (pricing_request.departure_time -
+                             utcnow()).total_seconds() / 3600
+    else:
+        departure_hour = -1
+        time_to_departure = 0.0
+    long_distance_sleeper = (
+        route.distance_km > 500 and
+        pricing_request.seat_type == schemas.SeatType.SLEEPER
+    )
+
+    suggested_fare, fare_adjustment_percentage, _, _, _ = _pricing_kernel(
+        base_fare, occupancy_rate, departure_hour,
+        time_to_departure, long_distance_sleeper
+    )
+
+    # Assemble reasoning from the same branch predicates the kernel used
     if occupancy_rate > 0.8:
-        occupancy_adjustment = 1.0 + \
-            (occupancy_rate - 0.8) * 2.5  # Up to 50% increase
         reasoning_parts.append(
             f"High occupancy ({occupancy_rate:.1%}) increases demand")
     elif occupancy_rate < 0.3:
-        occupancy_adjustment = 1.0 - \
-            (0.3 - occupancy_rate) * 0.67  # Up to 20% decrease
         reasoning_parts.append(
             f"Low occupancy ({occupancy_rate:.1%}) suggests price reduction")
     else:
         reasoning_parts.append(
             f"Moderate occupancy ({occupancy_rate:.1%}) maintains base pricing")
 
-    # Time-based adjustment (if departure time provided)
-    if pricing_request.departure_time:
-        departure_hour = pricing_request.departure_time.hour
-        if departure_hour in [7, 8, 9, 17, 18, 19]:  # Peak hours
-            time_adjustment = 1.15
+    if departure_hour >= 0:
+        if departure_hour in PEAK_HOURS:
             reasoning_parts.append("Peak hour timing increases price")
-        elif departure_hour in [22, 23, 0, 1, 2, 3, 4, 5]:  # Off-peak hours
-            time_adjustment = 0.9
+        elif departure_hour in OFF_PEAK_HOURS:
             reasoning_parts.append("Off-peak timing reduces price")
 
-        # Time to departure factor
-        time_to_departure = (pricing_request.departure_time -
-                             datetime.utcnow()).total_seconds() / 3600
-        if time_to_departure < 2:  # Less than 2 hours
-            demand_adjustment = 1.2
+        if time_to_departure < 2:
             reasoning_parts.append("Last-minute booking premium applied")
             confidence_score = min(confidence_score + 0.1, 1.0)
-        elif time_to_departure > 24 * 7:  # More than a week
-            demand_adjustment = 0.95
+        elif time_to_departure > 24 * 7:
             reasoning_parts.append("Early booking discount applied")
 
-    # Route-specific adjustments
-    if route.distance_km > 500:  # Long-distance routes
-        if pricing_request.seat_type == schemas.SeatType.SLEEPER:
-            demand_adjustment *= 1.1
-            reasoning_parts.append("Long-distance sleeper premium")
-
-    # Calculate final suggested fare
-    total_adjustment = occupancy_adjustment * time_adjustment * demand_adjustment
-    suggested_fare = base_fare * total_adjustment
-
-    # Apply bounds (10% below to 100% above base fare)
-    min_fare = base_fare * 0.9
-    max_fare = base_fare * 2.0
-    suggested_fare = max(min_fare, min(suggested_fare, max_fare))
-
-    # Calculate percentage adjustment
-    fare_adjustment_percentage = (
-        (suggested_fare - base_fare) / base_fare) * 100
+    if long_distance_sleeper:
+        reasoning_parts.append("Long-distance sleeper premium")
 
     # Adjust confidence based on data availability
-    if len(historical_data) < 10:
+    if historical_count < 10:
         confidence_score *= 0.8
         reasoning_parts.append("Limited historical data reduces confidence")
 
     reasoning = "; ".join(reasoning_parts)
 
-    # Store the pricing result for future reference
+    return schemas.PricingSuggestion.model_construct(
+        route_id=pricing_request.route_id,
+        seat_type=pricing_request.seat_type,
+        current_occupancy_rate=occupancy_rate,
+        current_fare=pricing_request.current_fare,
+        suggested_fare=_q2(suggested_fare),
+        fare_adjustment_percentage=_q1(fare_adjustment_percentage),
+        confidence_score=_q2(confidence_score),
+        reasoning=reasoning
+    )
+
+
+def persist_pricing_result(db: Session, suggestion: schemas.PricingSuggestion):
+    """Store a pricing result for future reference
+
+    Runs as a background task after the response is sent so the INSERT and
+    its commit stay off the request's critical path.
+    """
     try:
         pricing_result = models.PricingModelResult(
             schedule_id=None,  # This would be set if we had a specific schedule
-            seat_type=pricing_request.seat_type.value,
-            current_occupancy_rate=occupancy_rate,
-            current_fare=pricing_request.current_fare or base_fare,
-            suggested_fare=suggested_fare,
-            fare_adjustment_percentage=fare_adjustment_percentage,
-            confidence_score=confidence_score,
-            reasoning=reasoning
+            seat_type=suggestion.seat_type,
+            current_occupancy_rate=suggestion.current_occupancy_rate,
+            current_fare=suggestion.current_fare or suggestion.suggested_fare,
+            suggested_fare=suggestion.suggested_fare,
+            fare_adjustment_percentage=suggestion.fare_adjustment_percentage,
+            confidence_score=suggestion.confidence_score,
+            reasoning=suggestion.reasoning
         )
         db.add(pricing_result)
         db.commit()
@@ -277,27 +638,17 @@ def calculate_pricing_suggestion(
         logger.warning(f"Failed to store pricing result: {e}")
         db.rollback()
 
-    return schemas.PricingSuggestion(
-        route_id=pricing_request.route_id,
-        seat_type=pricing_request.seat_type.value,
-        current_occupancy_rate=occupancy_rate,
-        current_fare=pricing_request.current_fare,
-        suggested_fare=round(suggested_fare, 2),
-        fare_adjustment_percentage=round(fare_adjustment_percentage, 1),
-        confidence_score=round(confidence_score, 2),
-        reasoning=reasoning
-    )
-
 
 def get_data_quality_report(db: Session, days_back: int = 7) -> schemas.DataQualityReport:
     """Generate a data quality report for the last N days"""
 
-    start_date = datetime.utcnow() - timedelta(days=days_back)
+    start_date = utcnow() - timedelta(days=days_back)
 
-    # Get data quality issues
-    quality_issues = (
-        db.query(models.DataQualityLog)
+    # Get data quality issue counts grouped by type in a single query
+    issue_rows = (
+        db.query(models.DataQualityLog.issue_type, func.count().label("cnt"))
         .filter(models.DataQualityLog.detected_at >= start_date)
+        .group_by(models.DataQualityLog.issue_type)
         .all()
     )
 
@@ -308,21 +659,13 @@ def get_data_quality_report(db: Session, days_back: int = 7) -> schemas.DataQual
         .count()
     )
 
-    # Aggregate issues by type
-    issue_counts = {}
-    for issue in quality_issues:
-        issue_type = issue.issue_type
-        if issue_type not in issue_counts:
-            issue_counts[issue_type] = 0
-        issue_counts[issue_type] += 1
-
-    # Create issue summaries
+    # Create issue summaries directly from the grouped rows
     issue_summaries = []
-    for issue_type, count in issue_counts.items():
+    for issue_type, count in issue_rows:
         severity = "high" if count > total_occupancy_records * \
             0.1 else "medium" if count > total_occupancy_records * 0.05 else "low"
         issue_summaries.append(
-            schemas.DataQualityIssue(
+            schemas.DataQualityIssue.model_construct(
                 issue_type=issue_type,
                 description=f"Issues of type {issue_type} found in data",
                 count=count,
@@ -331,21 +674,37 @@ def get_data_quality_report(db: Session, days_back: int = 7) -> schemas.DataQual
         )
 
     # Calculate quality score
-    total_issues = len(quality_issues)
+    total_issues = sum(count for _, count in issue_rows)
     if total_occupancy_records > 0:
         quality_score = max(0, 1 - (total_issues / total_occupancy_records))
     else:
         quality_score = 1.0
 
-    return schemas.DataQualityReport(
+    return schemas.DataQualityReport.model_construct(
         total_records_processed=total_occupancy_records,
         valid_records=total_occupancy_records - total_issues,
         invalid_records=total_issues,
-        quality_score=round(quality_score, 3),
+        quality_score=_q3(quality_score),
         issues=issue_summaries
     )
 
 
+def bulk_insert_seat_occupancy(db: Session, records: List[dict]) -> int:
+    """Insert many seat occupancy records in a single batched statement
+
+    Goes through the Core table insert rather than per-row session.add,
+    so the whole batch ships as one executemany (multi-row INSERT under
+    psycopg2 batch mode) instead of one round-trip per record.
+    occupancy_rate is a generated column, so the database fills it in.
+    """
+    if not records:
+        return 0
+
+    db.execute(models.SeatOccupancy.__table__.insert(), records)
+    db.commit()
+    return len(records)
+
+
 def create_or_update_route(db: Session, route: dict) -> models.Route:
     """Create or update a route"""
     existing_route = (
@@ -361,9 +720,9 @@ def create_or_update_route(db: Session, route: dict) -> models.Route:
 
     if existing_route:
         existing_route.distance_km = route["distance_km"]
-        existing_route.updated_at = datetime.utcnow()
+        existing_route.updated_at = utcnow()
         db.commit()
-        db.refresh(existing_route)
+        _route_cache.pop(existing_route.route_id, None)
         return existing_route
     else:
         new_route = models.Route(**route)
@@ -373,6 +732,50 @@ def create_or_update_route(db: Session, route: dict) -> models.Route:
         return new_route
 
 
+def bulk_upsert_routes(db: Session, routes: List[dict]) -> List[models.Route]:
+    """Create or update many routes with a single lookup and a single commit
+
+    Avoids the per-record commit/fsync cost of calling create_or_update_route
+    in a loop (used by the ETL backfill path).
+    """
+    if not routes:
+        return []
+
+    keys = {(r["origin"], r["destination"]) for r in routes}
+    existing = (
+        db.query(models.Route)
+        .filter(
+            or_(*[
+                and_(models.Route.origin == origin,
+                     models.Route.destination == destination)
+                for origin, destination in keys
+            ])
+        )
+        .all()
+    )
+    existing_by_key = {(r.origin, r.destination): r for r in existing}
+
+    result = []
+    for route in routes:
+        existing_route = existing_by_key.get(
+            (route["origin"], route["destination"]))
+        if existing_route:
+            existing_route.distance_km = route["distance_km"]
+            existing_route.updated_at = utcnow()
+            result.append(existing_route)
+        else:
+            new_route = models.Route(**route)
+            db.add(new_route)
+            existing_by_key[(new_route.origin,
+                             new_route.destination)] = new_route
+            result.append(new_route)
+
+    db.commit()
+    for route in result:
+        _route_cache.pop(route.route_id, None)
+    return result
+
+
 def create_or_update_operator(db: Session, operator: dict) -> models.Operator:
     """Create or update an operator"""
     existing_operator = (
@@ -382,12 +785,15 @@ def create_or_update_operator(db: Session, operator: dict) -> models.Operator:
     )
 
     if existing_operator:
-        for key, value in operator.items():
-            if key != "operator_id":
-                setattr(existing_operator, key, value)
-        existing_operator.updated_at = datetime.utcnow()
+        # Single UPDATE statement instead of per-attribute change tracking
+        values = {k: v for k, v in operator.items() if k != "operator_id"}
+        values["updated_at"] = utcnow()
+        db.execute(
+            update(models.Operator)
+            .where(models.Operator.operator_id == existing_operator.operator_id)
+            .values(**values)
+        )
         db.commit()
-        db.refresh(existing_operator)
         return existing_operator
     else:
         new_operator = models.Operator(**operator)
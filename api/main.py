@@ -7,13 +7,15 @@ seat occupancy data, and dynamic pricing suggestions.
 
 import os
 import logging
+from operator import attrgetter
 from typing import List, Optional
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, date as date_type
 
-from fastapi import FastAPI, HTTPException, Depends, Query, status
+from fastapi import FastAPI, HTTPException, Depends, Query, status, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from sqlalchemy import create_engine
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
+from sqlalchemy import create_engine, select, func
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -37,8 +39,18 @@ POSTGRES_DB = os.getenv("POSTGRES_DB", "busdb")
 
 DATABASE_URL = f"postgresql://{POSTGRES_USER}:{POSTGRES_PASSWORD}@{POSTGRES_HOST}:{POSTGRES_PORT}/{POSTGRES_DB}"
 
-# Create database engine and session
-engine = create_engine(DATABASE_URL, pool_pre_ping=True)
+# Create database engine and session with an explicitly sized connection
+# pool so concurrent workers don't queue on the default 5-connection pool
+engine = create_engine(
+    DATABASE_URL,
+    pool_size=20,
+    max_overflow=10,
+    pool_recycle=1800,
+    pool_pre_ping=True,
+    # psycopg2 batch mode: multi-row INSERTs plus batched UPDATEs for
+    # executemany, cutting round-trips on bulk writes
+    executemany_mode="values_plus_batch"
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 # Create FastAPI app
@@ -47,7 +59,8 @@ app = FastAPI(
     description="API for bus schedule analytics, occupancy tracking, and dynamic pricing",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -59,6 +72,47 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress sizable responses (analytics payloads, large list endpoints)
+# for clients that send Accept-Encoding: gzip; small bodies pass through
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+
+# Field names cached from the schemas at import time; attrgetter pulls
+# all values in one C-level call instead of one getattr opcode per field
+_ROUTE_FIELDS = tuple(schemas.RouteResponse.model_fields)
+_route_values = attrgetter(*_ROUTE_FIELDS)
+_OPERATOR_FIELDS = tuple(schemas.OperatorResponse.model_fields)
+_operator_values = attrgetter(*_OPERATOR_FIELDS)
+
+
+def route_to_dict(route) -> schemas.RouteDict:
+    """Plain-dict view of a route matching schemas.RouteResponse"""
+    return dict(zip(_ROUTE_FIELDS, _route_values(route)))
+
+
+def operator_to_dict(operator) -> schemas.OperatorDict:
+    """Plain-dict view of an operator matching schemas.OperatorResponse"""
+    return dict(zip(_OPERATOR_FIELDS, _operator_values(operator)))
+
+
+def refresh_lookup_caches(db: Session):
+    """Load the (rarely changing) route and operator lookup tables into memory
+
+    Stores plain dicts rather than ORM objects so entries stay valid after
+    the loading session is closed.
+    """
+    app.state.routes_by_id = {
+        route.route_id: route_to_dict(route)
+        for route in crud.get_routes(db, limit=10000)
+    }
+    app.state.operators_by_id = {
+        operator.operator_id: operator_to_dict(operator)
+        for operator in crud.get_operators(db, limit=10000)
+    }
+    logger.info(
+        f"Lookup caches refreshed: {len(app.state.routes_by_id)} routes, "
+        f"{len(app.state.operators_by_id)} operators")
+
 
 # Dependency to get database session
 def get_db() -> Session:
@@ -77,6 +131,20 @@ async def startup_event():
     try:
         models.Base.metadata.create_all(bind=engine)
         logger.info("Database tables created successfully")
+
+        # Preload the route/operator lookup caches so hot single-row
+        # lookups never touch the database
+        db = SessionLocal()
+        try:
+            refresh_lookup_caches(db)
+        finally:
+            db.close()
+
+        # Build the OpenAPI schema once now; FastAPI memoizes it on
+        # app.openapi_schema, so the first /docs or /openapi.json request
+        # doesn't pay the multi-second schema construction
+        app.openapi()
+
         logger.info("Bus Pricing Pipeline API started successfully")
     except Exception as e:
         logger.error(f"Failed to initialize database: {e}")
@@ -106,7 +174,7 @@ async def value_error_handler(request, exc):
 @app.get("/health", response_model=schemas.HealthResponse)
 async def health_check():
     """Health check endpoint"""
-    return schemas.HealthResponse(status="ok", timestamp=datetime.utcnow())
+    return schemas.HealthResponse(status="ok", timestamp=crud.utcnow())
 
 
 # Route endpoints
@@ -120,7 +188,9 @@ async def get_routes(
     """Get all available routes"""
     try:
         routes = crud.get_routes(db, skip=skip, limit=limit)
-        return routes
+        # Returning a Response skips response-model re-validation; the rows
+        # come straight from the database and are already well-typed
+        return ORJSONResponse([route_to_dict(route) for route in routes])
     except Exception as e:
         logger.error(f"Error fetching routes: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch routes")
@@ -129,6 +199,11 @@ async def get_routes(
 @app.get("/routes/{route_id}", response_model=schemas.RouteResponse)
 async def get_route(route_id: int, db: Session = Depends(get_db)):
     """Get a specific route by ID"""
+    # Serve from the preloaded lookup cache when available
+    routes_by_id = getattr(app.state, "routes_by_id", None)
+    if routes_by_id is not None and route_id in routes_by_id:
+        return routes_by_id[route_id]
+
     route = crud.get_route(db, route_id=route_id)
     if not route:
         raise HTTPException(status_code=404, detail="Route not found")
@@ -145,7 +220,8 @@ async def get_operators(
     """Get all active operators"""
     try:
         operators = crud.get_operators(db, skip=skip, limit=limit)
-        return operators
+        return ORJSONResponse([operator_to_dict(operator)
+                               for operator in operators])
     except Exception as e:
         logger.error(f"Error fetching operators: {e}")
         raise HTTPException(
@@ -156,22 +232,19 @@ async def get_operators(
 @app.get("/schedules/{route_id}", response_model=List[schemas.ScheduleResponse])
 async def get_schedules(
     route_id: int,
-    date: str = Query(..., pattern=r'^\d{4}-\d{2}-\d{2}$',
-                      description="Date in YYYY-MM-DD format"),
+    date: date_type = Query(...,
+                            description="Date in YYYY-MM-DD format"),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     db: Session = Depends(get_db)
 ):
     """Get schedules for a specific route and date"""
     try:
-        # Validate date format
-        datetime.strptime(date, '%Y-%m-%d')
-        schedules = crud.get_schedules_by_route_and_date(
-            db, route_id=route_id, date=date, skip=skip, limit=limit)
-        return schedules
-    except ValueError:
-        raise HTTPException(
-            status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
+        # Pydantic has already parsed the date; pass it straight through
+        schedules, total = crud.get_schedules_by_route_and_date(
+            db, route_id=route_id, target_date=date, skip=skip, limit=limit)
+        return ORJSONResponse(
+            schedules, headers={"X-Total-Count": str(total)})
     except Exception as e:
         logger.error(f"Error fetching schedules: {e}")
         raise HTTPException(
@@ -184,37 +257,70 @@ async def get_schedule_with_occupancy(schedule_id: int, db: Session = Depends(ge
     schedule = crud.get_schedule_with_occupancy(db, schedule_id=schedule_id)
     if not schedule:
         raise HTTPException(status_code=404, detail="Schedule not found")
-    return schedule
+    return ORJSONResponse(
+        crud.schedule_occupancy_response(schedule).model_dump())
 
 
 # Analytics endpoints
 @app.get("/analytics/occupancy", response_model=schemas.OccupancyStats)
 async def get_occupancy_analytics(
     route_id: Optional[int] = Query(None, description="Filter by route ID"),
-    date: Optional[str] = Query(
-        None, pattern=r'^\d{4}-\d{2}-\d{2}$', description="Filter by date (YYYY-MM-DD)"),
+    date: Optional[date_type] = Query(
+        None, description="Filter by date (YYYY-MM-DD)"),
     seat_type: Optional[schemas.SeatType] = Query(
         None, description="Filter by seat type"),
     db: Session = Depends(get_db)
 ):
     """Get occupancy analytics with optional filters"""
     try:
-        if date:
-            # Validate date format
-            datetime.strptime(date, '%Y-%m-%d')
-
         stats = crud.get_occupancy_stats(
             db,
             route_id=route_id,
-            date=date,
+            target_date=date,
             seat_type=seat_type.value if seat_type else None
         )
         return stats
+    except Exception as e:
+        logger.error(f"Error calculating occupancy analytics: {e}")
+        raise HTTPException(
+            status_code=500, detail="Failed to calculate analytics")
+
+
+@app.get("/analytics/occupancy/batch", response_model=List[schemas.OccupancyStats])
+async def get_occupancy_analytics_batch(
+    route_ids: str = Query(...,
+                           description="Comma-separated route IDs (e.g. 1,2,3)"),
+    date: Optional[date_type] = Query(
+        None, description="Filter by date (YYYY-MM-DD)"),
+    seat_type: Optional[schemas.SeatType] = Query(
+        None, description="Filter by seat type"),
+    db: Session = Depends(get_db)
+):
+    """Get occupancy analytics for several routes in one request
+
+    One grouped aggregate query serves all requested routes, avoiding the
+    N+1 round-trip pattern of calling /analytics/occupancy per route.
+    """
+    try:
+        parsed_ids = [int(part) for part in route_ids.split(",") if part.strip()]
     except ValueError:
         raise HTTPException(
-            status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
+            status_code=422, detail="route_ids must be comma-separated integers")
+    if not parsed_ids or len(parsed_ids) > 100:
+        raise HTTPException(
+            status_code=422, detail="route_ids must contain 1-100 IDs")
+
+    try:
+        return crud.get_occupancy_stats_batch(
+            db,
+            route_ids=parsed_ids,
+            target_date=date,
+            seat_type=seat_type.value if seat_type else None
+        )
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"Error calculating occupancy analytics: {e}")
+        logger.error(f"Error calculating batch occupancy analytics: {e}")
         raise HTTPException(
             status_code=500, detail="Failed to calculate analytics")
 
@@ -223,11 +329,15 @@ async def get_occupancy_analytics(
 @app.post("/pricing/suggest", response_model=schemas.PricingSuggestion)
 async def suggest_pricing(
     pricing_request: schemas.PricingRequest,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db)
 ):
     """Get dynamic pricing suggestions based on current conditions"""
     try:
         suggestion = crud.calculate_pricing_suggestion(db, pricing_request)
+        # Persist the result after the response is sent; the caller doesn't
+        # need to wait for this INSERT
+        background_tasks.add_task(crud.persist_pricing_result, db, suggestion)
         logger.info(
             f"Pricing suggestion generated for route {pricing_request.route_id}: {suggestion.suggested_fare}")
         return suggestion
@@ -262,6 +372,8 @@ async def create_route(route_data: schemas.RouteBase, db: Session = Depends(get_
     """Create or update a route (used by ETL process)"""
     try:
         route = crud.create_or_update_route(db, route_data.dict())
+        if hasattr(app.state, "routes_by_id"):
+            refresh_lookup_caches(db)
         return route
     except Exception as e:
         logger.error(f"Error creating/updating route: {e}")
@@ -269,11 +381,44 @@ async def create_route(route_data: schemas.RouteBase, db: Session = Depends(get_
             status_code=500, detail="Failed to create/update route")
 
 
+@app.post("/admin/routes/bulk", response_model=List[schemas.RouteResponse])
+async def create_routes_bulk(routes_data: List[schemas.RouteBase], db: Session = Depends(get_db)):
+    """Create or update many routes in a single transaction (used by ETL backfills)"""
+    try:
+        routes = crud.bulk_upsert_routes(
+            db, [route.dict() for route in routes_data])
+        if hasattr(app.state, "routes_by_id"):
+            refresh_lookup_caches(db)
+        return routes
+    except Exception as e:
+        logger.error(f"Error bulk creating/updating routes: {e}")
+        raise HTTPException(
+            status_code=500, detail="Failed to bulk create/update routes")
+
+
+@app.post("/admin/occupancy/bulk")
+async def create_occupancy_bulk(
+    occupancy_data: List[schemas.SeatOccupancyCreate],
+    db: Session = Depends(get_db)
+):
+    """Ingest many seat occupancy records in one batched insert (used by ETL)"""
+    try:
+        inserted = crud.bulk_insert_seat_occupancy(
+            db, [record.dict() for record in occupancy_data])
+        return {"inserted": inserted}
+    except Exception as e:
+        logger.error(f"Error bulk inserting seat occupancy: {e}")
+        raise HTTPException(
+            status_code=500, detail="Failed to bulk insert seat occupancy")
+
+
 @app.post("/admin/operators", response_model=schemas.OperatorResponse)
 async def create_operator(operator_data: schemas.OperatorBase, db: Session = Depends(get_db)):
     """Create or update an operator (used by ETL process)"""
     try:
         operator = crud.create_or_update_operator(db, operator_data.dict())
+        if hasattr(app.state, "operators_by_id"):
+            refresh_lookup_caches(db)
         return operator
     except Exception as e:
         logger.error(f"Error creating/updating operator: {e}")
@@ -286,20 +431,34 @@ async def create_operator(operator_data: schemas.OperatorBase, db: Session = Dep
 async def get_summary_stats(db: Session = Depends(get_db)):
     """Get overall system statistics"""
     try:
-        # Count various entities
-        total_routes = db.query(models.Route).count()
-        total_operators = db.query(models.Operator).filter(
-            models.Operator.is_active == True).count()
-        total_schedules = db.query(models.Schedule).filter(
-            models.Schedule.is_active == True).count()
-        total_occupancy_records = db.query(models.SeatOccupancy).count()
-
-        # Recent activity (last 24 hours)
-        yesterday = datetime.utcnow() - timedelta(hours=24)
-        recent_schedules = db.query(models.Schedule).filter(
-            models.Schedule.created_at >= yesterday).count()
-        recent_occupancy = db.query(models.SeatOccupancy).filter(
-            models.SeatOccupancy.created_at >= yesterday).count()
+        # Fold all entity counts into a single round trip using scalar subqueries
+        yesterday = crud.utcnow() - timedelta(hours=24)
+        counts_stmt = select(
+            select(func.count()).select_from(models.Route)
+            .scalar_subquery().label("total_routes"),
+            select(func.count()).select_from(models.Operator)
+            .where(models.Operator.is_active == True)
+            .scalar_subquery().label("total_operators"),
+            select(func.count()).select_from(models.Schedule)
+            .where(models.Schedule.is_active == True)
+            .scalar_subquery().label("total_schedules"),
+            select(func.count()).select_from(models.SeatOccupancy)
+            .scalar_subquery().label("total_occupancy_records"),
+            select(func.count()).select_from(models.Schedule)
+            .where(models.Schedule.created_at >= yesterday)
+            .scalar_subquery().label("recent_schedules"),
+            select(func.count()).select_from(models.SeatOccupancy)
+            .where(models.SeatOccupancy.created_at >= yesterday)
+            .scalar_subquery().label("recent_occupancy"),
+        )
+        counts = db.execute(counts_stmt).one()
+
+        total_routes = counts.total_routes
+        total_operators = counts.total_operators
+        total_schedules = counts.total_schedules
+        total_occupancy_records = counts.total_occupancy_records
+        recent_schedules = counts.recent_schedules
+        recent_occupancy = counts.recent_occupancy
 
         return {
             "system_status": "operational",
@@ -311,7 +470,7 @@ async def get_summary_stats(db: Session = Depends(get_db)):
                 "schedules_last_24h": recent_schedules,
                 "occupancy_records_last_24h": recent_occupancy
             },
-            "timestamp": datetime.utcnow()
+            "timestamp": crud.utcnow()
         }
     except Exception as e:
         logger.error(f"Error fetching summary stats: {e}")
@@ -2,28 +2,34 @@
 SQLAlchemy database models for the bus pricing system
 """
 
-from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, ForeignKey, Text
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
+from typing import List, Optional
+
+from sqlalchemy import SmallInteger, String, Float, DateTime, Boolean, ForeignKey, Text, Index, Computed, CheckConstraint, text
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 from datetime import datetime
 
-Base = declarative_base()
+
+class Base(DeclarativeBase):
+    """Declarative base (2.0 style, enables insertmanyvalues fast paths)"""
 
 
 class Route(Base):
     """Route model representing bus routes"""
     __tablename__ = "routes"
 
-    route_id = Column(Integer, primary_key=True, index=True)
-    origin = Column(String(100), nullable=False, index=True)
-    destination = Column(String(100), nullable=False, index=True)
-    distance_km = Column(Float, nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    route_id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    origin: Mapped[str] = mapped_column(String(100), index=True)
+    destination: Mapped[str] = mapped_column(String(100), index=True)
+    distance_km: Mapped[float]
+    created_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True))  # maintained by DB trigger
 
     # Relationships
-    schedules = relationship("Schedule", back_populates="route")
+    schedules: Mapped[List["Schedule"]] = relationship(
+        back_populates="route")
 
     def __repr__(self):
         return f"<Route(route_id={self.route_id}, origin={self.origin}, destination={self.destination})>"
@@ -33,16 +39,19 @@ class Operator(Base):
     """Operator model representing bus operators"""
     __tablename__ = "operators"
 
-    operator_id = Column(Integer, primary_key=True, index=True)
-    name = Column(String(100), nullable=False, index=True)
-    contact_email = Column(String(100), nullable=True)
-    contact_phone = Column(String(20), nullable=True)
-    is_active = Column(Boolean, default=True, nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    operator_id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    name: Mapped[str] = mapped_column(String(100), index=True)
+    contact_email: Mapped[Optional[str]] = mapped_column(String(100))
+    contact_phone: Mapped[Optional[str]] = mapped_column(String(20))
+    is_active: Mapped[bool] = mapped_column(default=True)
+    created_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True))  # maintained by DB trigger
 
     # Relationships
-    schedules = relationship("Schedule", back_populates="operator")
+    schedules: Mapped[List["Schedule"]] = relationship(
+        back_populates="operator")
 
     def __repr__(self):
         return f"<Operator(operator_id={self.operator_id}, name={self.name})>"
@@ -52,23 +61,40 @@ class Schedule(Base):
     """Schedule model representing bus schedules"""
     __tablename__ = "schedules"
 
-    schedule_id = Column(Integer, primary_key=True, index=True)
-    route_id = Column(Integer, ForeignKey("routes.route_id"),
-                      nullable=False, index=True)
-    operator_id = Column(Integer, ForeignKey(
-        "operators.operator_id"), nullable=False, index=True)
-    departure_time = Column(DateTime(timezone=True),
-                            nullable=False, index=True)
-    arrival_time = Column(DateTime(timezone=True), nullable=False)
-    date = Column(DateTime(timezone=True), nullable=False, index=True)
-    is_active = Column(Boolean, default=True, nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
-
-    # Relationships
-    route = relationship("Route", back_populates="schedules")
-    operator = relationship("Operator", back_populates="schedules")
-    seat_occupancy = relationship("SeatOccupancy", back_populates="schedule")
+    # The hot lookup is (route_id, date); a composite index serves it with
+    # one scan and supersedes separate route_id/date indexes
+    __table_args__ = (
+        Index("ix_schedules_route_date", "route_id", "date"),
+        # Partial index: queries only ever look at active schedules, so
+        # there is no point indexing (or dirtying pages for) inactive rows
+        Index("ix_schedule_active", "departure_time",
+              postgresql_where=text("is_active")),
+        CheckConstraint("arrival_time > departure_time",
+                        name="ck_sched_arr_gt_dep"),
+    )
+
+    schedule_id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    route_id: Mapped[int] = mapped_column(ForeignKey("routes.route_id"))
+    operator_id: Mapped[int] = mapped_column(
+        ForeignKey("operators.operator_id"), index=True)
+    departure_time: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), index=True)
+    arrival_time: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    date: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    is_active: Mapped[bool] = mapped_column(default=True)
+    created_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True))  # maintained by DB trigger
+
+    # Relationships - default loader strategies avoid lazy-load N+1 wherever
+    # schedules are serialized, without per-query .options() boilerplate
+    route: Mapped["Route"] = relationship(
+        lazy="joined", back_populates="schedules")
+    operator: Mapped["Operator"] = relationship(
+        lazy="joined", back_populates="schedules")
+    seat_occupancy: Mapped[List["SeatOccupancy"]] = relationship(
+        lazy="selectin", back_populates="schedule")
 
     def __repr__(self):
         return f"<Schedule(schedule_id={self.schedule_id}, route_id={self.route_id}, departure_time={self.departure_time})>"
@@ -78,22 +104,51 @@ class SeatOccupancy(Base):
     """Seat occupancy model representing seat occupancy data"""
     __tablename__ = "seat_occupancy"
 
-    id = Column(Integer, primary_key=True, index=True)
-    schedule_id = Column(Integer, ForeignKey(
-        "schedules.schedule_id"), nullable=False, index=True)
+    # Composite index matching the (schedule_id, seat_type, timestamp)
+    # access pattern; the INCLUDE columns let Postgres answer the stats
+    # aggregates with index-only scans instead of heap fetches
+    __table_args__ = (
+        Index(
+            "ix_so_sched_type_ts",
+            "schedule_id", "seat_type", "timestamp",
+            postgresql_include=[
+                "occupancy_rate", "fare", "total_seats", "occupied_seats"]
+        ),
+        CheckConstraint("occupied_seats <= total_seats",
+                        name="ck_so_occupied_le_total"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    schedule_id: Mapped[int] = mapped_column(
+        ForeignKey("schedules.schedule_id"))
     # regular, premium, sleeper
-    seat_type = Column(String(20), nullable=False, index=True)
-    total_seats = Column(Integer, nullable=False)
-    occupied_seats = Column(Integer, nullable=False)
-    fare = Column(Float, nullable=False)
-    occupancy_rate = Column(Float, nullable=True)  # Calculated field
-    timestamp = Column(DateTime(timezone=True),
-                       server_default=func.now(), index=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    seat_type: Mapped[str] = mapped_column(String(20))
+    # SMALLINT halves the bytes per seat count (buses stay well under
+    # 32767 seats), shrinking rows and index leaf pages on the hot scans
+    total_seats: Mapped[int] = mapped_column(SmallInteger)
+    occupied_seats: Mapped[int] = mapped_column(SmallInteger)
+    fare: Mapped[float]
+    # Generated by the database so the value can never go stale; the
+    # clamped CASE keeps the rate in [0, 1] even for inconsistent counts
+    occupancy_rate: Mapped[Optional[float]] = mapped_column(
+        Float(precision=24),
+        Computed(
+            "CASE WHEN total_seats <= 0 THEN 0 "
+            "WHEN occupied_seats >= total_seats THEN 1.0 "
+            "ELSE occupied_seats * 1.0 / total_seats END",
+            persisted=True
+        )
+    )
+    timestamp: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), server_default=func.now())
+    created_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True))  # maintained by DB trigger
 
     # Relationships
-    schedule = relationship("Schedule", back_populates="seat_occupancy")
+    schedule: Mapped["Schedule"] = relationship(
+        back_populates="seat_occupancy")
 
     def __repr__(self):
         return f"<SeatOccupancy(id={self.id}, schedule_id={self.schedule_id}, seat_type={self.seat_type}, occupancy_rate={self.occupancy_rate})>"
@@ -103,17 +158,25 @@ class DataQualityLog(Base):
     """Data quality log model for tracking data issues"""
     __tablename__ = "data_quality_log"
 
-    id = Column(Integer, primary_key=True, index=True)
-    issue_type = Column(String(50), nullable=False, index=True)
-    description = Column(Text, nullable=False)
-    record_id = Column(String(100), nullable=True, index=True)
+    # Partial index for the triage query (open critical issues); a full
+    # B-tree on low-cardinality severity would bloat every ingest write
+    __table_args__ = (
+        Index("ix_dql_unresolved_critical", "detected_at",
+              postgresql_where=text("not resolved and severity = 'critical'")),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    issue_type: Mapped[str] = mapped_column(String(50), index=True)
+    description: Mapped[str] = mapped_column(Text)
+    record_id: Mapped[Optional[str]] = mapped_column(String(100), index=True)
     # low, medium, high, critical
-    severity = Column(String(20), nullable=False, default="medium")
-    resolved = Column(Boolean, default=False, nullable=False)
-    resolution_action = Column(Text, nullable=True)
-    detected_at = Column(DateTime(timezone=True),
-                         server_default=func.now(), index=True)
-    resolved_at = Column(DateTime(timezone=True), nullable=True)
+    severity: Mapped[str] = mapped_column(String(20), default="medium")
+    resolved: Mapped[bool] = mapped_column(default=False)
+    resolution_action: Mapped[Optional[str]] = mapped_column(Text)
+    detected_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), index=True)
+    resolved_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True))
 
     def __repr__(self):
         return f"<DataQualityLog(id={self.id}, issue_type={self.issue_type}, severity={self.severity})>"
@@ -123,22 +186,23 @@ class PricingModelResult(Base):
     """Pricing model results for tracking pricing suggestions"""
     __tablename__ = "pricing_model_results"
 
-    id = Column(Integer, primary_key=True, index=True)
-    schedule_id = Column(Integer, ForeignKey(
-        "schedules.schedule_id"), nullable=True, index=True)
-    seat_type = Column(String(20), nullable=False)
-    current_occupancy_rate = Column(Float, nullable=False)
-    current_fare = Column(Float, nullable=True)
-    suggested_fare = Column(Float, nullable=False)
-    fare_adjustment_percentage = Column(Float, nullable=False)
-    confidence_score = Column(Float, nullable=False)
-    reasoning = Column(Text, nullable=False)
-    model_version = Column(String(20), nullable=False, default="heuristic_v1")
-    calculation_timestamp = Column(
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    schedule_id: Mapped[Optional[int]] = mapped_column(
+        ForeignKey("schedules.schedule_id"), index=True)
+    seat_type: Mapped[str] = mapped_column(String(20))
+    current_occupancy_rate: Mapped[float]
+    current_fare: Mapped[Optional[float]]
+    suggested_fare: Mapped[float]
+    fare_adjustment_percentage: Mapped[float]
+    confidence_score: Mapped[float]
+    reasoning: Mapped[str] = mapped_column(Text)
+    model_version: Mapped[str] = mapped_column(
+        String(20), default="heuristic_v1")
+    calculation_timestamp: Mapped[Optional[datetime]] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), index=True)
 
     # Relationship
-    schedule = relationship("Schedule")
+    schedule: Mapped[Optional["Schedule"]] = relationship()
 
     def __repr__(self):
         return f"<PricingModelResult(id={self.id}, schedule_id={self.schedule_id}, suggested_fare={self.suggested_fare})>"
@@ -148,13 +212,14 @@ class SystemHealth(Base):
     """System health tracking model"""
     __tablename__ = "system_health"
 
-    id = Column(Integer, primary_key=True, index=True)
-    service_name = Column(String(50), nullable=False, index=True)
-    status = Column(String(20), nullable=False)  # healthy, unhealthy, degraded
-    response_time_ms = Column(Float, nullable=True)
-    error_message = Column(Text, nullable=True)
-    checked_at = Column(DateTime(timezone=True),
-                        server_default=func.now(), index=True)
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    service_name: Mapped[str] = mapped_column(String(50), index=True)
+    # healthy, unhealthy, degraded
+    status: Mapped[str] = mapped_column(String(20))
+    response_time_ms: Mapped[Optional[float]]
+    error_message: Mapped[Optional[str]] = mapped_column(Text)
+    checked_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), index=True)
 
     def __repr__(self):
         return f"<SystemHealth(id={self.id}, service_name={self.service_name}, status={self.status})>"
@@ -5,11 +5,35 @@ Defines the data validation and serialization schemas for the
 Bus Pricing Pipeline API endpoints.
 """
 
+import re
+import time
+
 from pydantic import BaseModel, Field, field_validator
-from typing import Optional, List
-from datetime import datetime, timezone
+from typing import Any, Optional, List, TypedDict
+from datetime import datetime, date, timezone
 from enum import Enum
 
+# Compiled once at import; per-request date validation only pays for a
+# cached regex match plus the date() constructor's range checks
+_DATE_RE = re.compile(r'^(\d{4})-(\d{2})-(\d{2})$')
+
+# Coarse UTC clock for response timestamps: refreshed at ~1ms granularity
+# so building many timestamped models costs one monotonic read instead of
+# a full system-clock call per instance
+_NOW_MAX_AGE = 0.001
+_now_value = datetime.now(timezone.utc)
+_now_read_at = time.monotonic()
+
+
+def utc_now_coarse() -> datetime:
+    """Current UTC time, cached for up to a millisecond"""
+    global _now_value, _now_read_at
+    mono = time.monotonic()
+    if mono - _now_read_at > _NOW_MAX_AGE:
+        _now_value = datetime.now(timezone.utc)
+        _now_read_at = mono
+    return _now_value
+
 
 class SeatType(str, Enum):
     """Enumeration of seat types"""
@@ -18,11 +42,15 @@ class SeatType(str, Enum):
     SLEEPER = "sleeper"
 
 
+# Hot request fields validate seat types against this frozenset; a plain
+# membership check skips Enum.__call__ dispatch on every ingest record
+_SEAT_TYPES = frozenset(member.value for member in SeatType)
+
+
 class HealthResponse(BaseModel):
     """Health check response"""
     status: str = "ok"
-    timestamp: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc))
+    timestamp: datetime = Field(default_factory=utc_now_coarse)
     version: str = "1.0.0"
 
 
@@ -87,11 +115,18 @@ class ScheduleResponse(ScheduleBase):
 
 class SeatOccupancyBase(BaseModel):
     """Base seat occupancy schema"""
-    seat_type: SeatType
+    seat_type: str
     total_seats: int = Field(..., gt=0)
     occupied_seats: int = Field(..., ge=0)
     fare: float = Field(..., gt=0)
 
+    @field_validator('seat_type')
+    def validate_seat_type(cls, v):
+        if v not in _SEAT_TYPES:
+            raise ValueError(
+                f"seat_type must be one of {sorted(_SEAT_TYPES)}")
+        return v
+
     @field_validator('occupied_seats')
     def occupied_not_exceed_total(cls, v, info):
         if info.data.get('total_seats') and v > info.data['total_seats']:
@@ -99,6 +134,11 @@ class SeatOccupancyBase(BaseModel):
         return v
 
 
+class SeatOccupancyCreate(SeatOccupancyBase):
+    """Seat occupancy ingest schema"""
+    schedule_id: int
+
+
 class SeatOccupancyResponse(SeatOccupancyBase):
     """Seat occupancy response schema"""
     id: int
@@ -115,19 +155,66 @@ class ScheduleWithOccupancy(ScheduleResponse):
     seat_occupancy: List[SeatOccupancyResponse] = []
 
 
+# Plain-dict shapes for payloads assembled by hand on the read paths.
+# TypedDicts carry the field typing without building a Pydantic validator
+# per nested object, since these dicts are serialized as-is.
+
+class RouteDict(TypedDict):
+    """Dict form of RouteResponse for pre-serialized payloads"""
+    route_id: int
+    origin: str
+    destination: str
+    distance_km: float
+    created_at: datetime
+
+
+class OperatorDict(TypedDict):
+    """Dict form of OperatorResponse for pre-serialized payloads"""
+    operator_id: int
+    name: str
+    contact_email: Optional[str]
+    contact_phone: Optional[str]
+    is_active: bool
+    created_at: datetime
+
+
+class ScheduleDict(TypedDict):
+    """Dict form of ScheduleResponse for pre-serialized payloads"""
+    schedule_id: int
+    route_id: int
+    operator_id: int
+    departure_time: datetime
+    arrival_time: datetime
+    date: datetime
+    is_active: bool
+    route: RouteDict
+    operator: OperatorDict
+
+
 class OccupancyStatsRequest(BaseModel):
     """Request schema for occupancy statistics"""
     route_id: Optional[int] = None
-    date: Optional[str] = Field(None, pattern=r'^\d{4}-\d{2}-\d{2}$')
-    seat_type: Optional[SeatType] = None
+    date: Optional[str] = None
+    seat_type: Optional[str] = None
+
+    @field_validator('seat_type')
+    def validate_seat_type(cls, v):
+        if v is not None and v not in _SEAT_TYPES:
+            raise ValueError(
+                f"seat_type must be one of {sorted(_SEAT_TYPES)}")
+        return v
 
     @field_validator('date')
     def validate_date_format(cls, v):
         if v:
+            match = _DATE_RE.match(v)
+            if not match:
+                raise ValueError('Date must be in YYYY-MM-DD format')
+            year, month, day = map(int, match.groups())
             try:
-                datetime.strptime(v, '%Y-%m-%d')
+                date(year, month, day)
             except ValueError:
-                raise ValueError('Date must be in YYYY-MM-DD format')
+                raise ValueError('Date must be a valid calendar date')
         return v
 
 
@@ -150,11 +237,18 @@ class OccupancyStats(BaseModel):
 class PricingRequest(BaseModel):
     """Pricing suggestion request"""
     route_id: int = Field(..., gt=0)
-    seat_type: SeatType
+    seat_type: str
     current_occupancy_rate: float = Field(..., ge=0, le=1)
     departure_time: Optional[datetime] = None
     current_fare: Optional[float] = Field(None, gt=0)
 
+    @field_validator('seat_type')
+    def validate_seat_type(cls, v):
+        if v not in _SEAT_TYPES:
+            raise ValueError(
+                f"seat_type must be one of {sorted(_SEAT_TYPES)}")
+        return v
+
     @field_validator('current_occupancy_rate')
     def validate_occupancy_rate(cls, v):
         if not 0 <= v <= 1:
@@ -173,8 +267,7 @@ class PricingSuggestion(BaseModel):
     confidence_score: float = Field(..., ge=0, le=1)
     reasoning: str
     model_version: str = "heuristic_v1"
-    calculation_timestamp: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc))
+    calculation_timestamp: datetime = Field(default_factory=utc_now_coarse)
 
 
 class DataQualityIssue(BaseModel):
@@ -187,8 +280,7 @@ class DataQualityIssue(BaseModel):
 
 class DataQualityReport(BaseModel):
     """Data quality report response"""
-    report_date: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc))
+    report_date: datetime = Field(default_factory=utc_now_coarse)
     total_records_processed: int
     valid_records: int
     invalid_records: int
@@ -200,8 +292,7 @@ class ErrorResponse(BaseModel):
     """Error response schema"""
     error: str
     detail: Optional[str] = None
-    timestamp: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc))
+    timestamp: datetime = Field(default_factory=utc_now_coarse)
 
 
 class PaginationParams(BaseModel):
@@ -215,15 +306,20 @@ class PaginationParams(BaseModel):
 
 
 class PaginatedResponse(BaseModel):
-    """Paginated response wrapper"""
-    items: List[BaseModel]
+    """Paginated response wrapper
+
+    items is deliberately untyped: the rows are already validated (or
+    trusted) before they reach the envelope, and List[BaseModel] would
+    make Pydantic re-walk every item on construction.
+    """
+    items: List[Any]
     total: int
     page: int
     page_size: int
-    total_pages: int
+    total_pages: int = 0
 
-    @field_validator('total_pages', mode='before')
-    def calculate_total_pages(cls, v, info):
-        if info.data.get('total') and info.data.get('page_size'):
-            return (info.data['total'] + info.data['page_size'] - 1) // info.data['page_size']
-        return v
+    def __init__(self, **data):
+        if not data.get('total_pages') and data.get('page_size'):
+            data['total_pages'] = -(-data.get('total', 0)
+                                    // data['page_size'])
+        super().__init__(**data)
@@ -10,12 +10,45 @@ import json
 import os
 import random
 import logging
-from datetime import datetime, timedelta
-from typing import List, Dict, Any
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Any, Tuple
 from pathlib import Path
+
+import numpy as np
 from faker import Faker
 from faker.providers import automotive, company, person
 
+# orjson serializes nested dict-of-list payloads in native code, several
+# times faster than the pure-Python json encoder; fall back to json where
+# orjson is not installed
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+
+    def _dump_json(path: Path, obj: Dict[str, Any]) -> None:
+        """Write obj to path as 2-space-indented JSON"""
+        path.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        """Compact JSON bytes for one record (stdlib fallback)"""
+        return json.dumps(obj).encode()
+
+    def _dump_json(path: Path, obj: Dict[str, Any]) -> None:
+        """Write obj to path as 2-space-indented JSON"""
+        with open(path, 'w') as f:
+            json.dump(obj, f, indent=2)
+
+# Optional columnar output: Parquet via PyArrow shrinks the low-cardinality
+# string columns with dictionary encoding and lets downstream readers skip
+# JSON reparsing entirely. JSON output needs no extra dependency.
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO,
                     format='%(asctime)s - %(levelname)s - %(message)s')
@@ -86,6 +119,31 @@ def generate_operators():
 
 OPERATORS = generate_operators()
 
+# route_id -> route row, for callers holding a schedule without the
+# carried route reference
+ROUTES_BY_ID = {route["route_id"]: route for route in ROUTES}
+
+# Departure-time pattern shared by the scalar and vectorized samplers:
+# 40% of buses leave during popular commuter hours
+POPULAR_HOURS = [7, 8, 9, 17, 18, 19, 20]
+DEPARTURE_MINUTES = [0, 15, 30, 45]
+
+# Popularity-keyed speed ranges in km/h (more traffic on popular routes);
+# a dict gather replaces a per-schedule branch chain
+POPULARITY_SPEED_RANGE = {
+    "high": (45, 60),
+    "medium": (50, 65),
+    "low": (55, 70),
+}
+
+# Occupancy multiplier bounds (percent) keyed by route popularity; only
+# the applicable entry is ever drawn from
+POPULARITY_OCCUPANCY_RANGE = {
+    "high": (110, 130),
+    "medium": (90, 110),
+    "low": (70, 90),
+}
+
 # Seat types and their typical counts
 SEAT_TYPES = {
     "regular": {"typical_count": 40, "base_fare_multiplier": 1.0},
@@ -93,6 +151,128 @@ SEAT_TYPES = {
     "sleeper": {"typical_count": 30, "base_fare_multiplier": 2.0}
 }
 
+# Cached seat-type combinations: the full triple plus each two-type subset
+# (indexed by the dropped type), so per-bus selection is a tuple lookup
+# with no list building or unique-sampling loop
+SEAT_TYPE_NAMES = tuple(SEAT_TYPES)
+SEAT_TYPE_PAIRS = tuple(
+    tuple(name for j, name in enumerate(SEAT_TYPE_NAMES) if j != i)
+    for i in range(len(SEAT_TYPE_NAMES))
+)
+
+
+# Character tables for vectorized template filling
+_DIGIT_CHARS = np.array(list("0123456789"))
+_LETTER_CHARS = np.array(list("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"))
+
+
+def _fill_template_pool(rng: np.random.Generator, template: str,
+                        size: int) -> List[str]:
+    """Batch-generate strings from a Faker-style bothify template
+
+    '#' becomes a random digit and '?' a random letter, like
+    fake.bothify, but each template slot is one bulk NumPy draw plus a
+    np.char column concat instead of per-string Python-level sampling.
+    """
+    columns = []
+    for char in template:
+        if char == '#':
+            columns.append(_DIGIT_CHARS[rng.integers(0, 10, size=size)])
+        elif char == '?':
+            columns.append(
+                _LETTER_CHARS[rng.integers(0, len(_LETTER_CHARS), size=size)])
+        else:
+            columns.append(np.full(size, char))
+    pool = columns[0]
+    for column in columns[1:]:
+        pool = np.char.add(pool, column)
+    return pool.tolist()
+
+
+def _iso(epoch: int) -> str:
+    """ISO-8601 string for int epoch seconds (local time, like isoformat)"""
+    return datetime.fromtimestamp(epoch).isoformat()
+
+
+def _base_fare_kernel(distance_km: float, seat_multiplier: float,
+                      rate_rand: int, variance_rand: int) -> float:
+    """Pure-arithmetic fare kernel operating on pre-drawn randoms
+
+    Lifted to module scope so the per-record fare computation is plain
+    local-variable arithmetic: no attribute lookups, no RNG calls inside.
+    The two random inputs are raw draws from the batched pool; the kernel
+    folds them into the ₹/km rate and the ±10% variance itself.
+    """
+    if distance_km < 200:  # Short routes: ₹2.5-3.5 per km
+        rate_per_km = (25 + rate_rand % 11) / 10
+    elif distance_km < 400:  # Medium routes: ₹2.0-3.0 per km
+        rate_per_km = (20 + rate_rand % 11) / 10
+    else:  # Long routes: ₹1.5-2.5 per km
+        rate_per_km = (15 + rate_rand % 11) / 10
+
+    # Minimum ₹50 fare, seat-type multiplier, then ±10% variance
+    base_fare = max(50.0, distance_km * rate_per_km)
+    return round(base_fare * seat_multiplier * (90 + variance_rand % 21) / 100, 2)
+
+
+def _occupancy_kernel(total_seats: int, base_fare: float,
+                      departure_hour: int, day_of_week: int,
+                      pop_lo: int, pop_hi: int,
+                      r0: int, r1: int, r2: int, r3: int,
+                      r4: int, r5: int, r6: int, r7: int) -> Tuple[int, float]:
+    """Pure-arithmetic occupancy/fare kernel on pre-drawn randoms
+
+    Companion to _base_fare_kernel: the whole numeric portion of a seat
+    occupancy record (time-of-day occupancy, weekend and popularity
+    factors, count-error injection, demand pricing, fare anomalies) as
+    branches and integer folds over eight raw pool draws, with no
+    attribute lookups or RNG calls inside.
+
+    Returns (occupied_seats, fare).
+    """
+    # Base occupancy by time of day
+    if 7 <= departure_hour <= 9 or 17 <= departure_hour <= 19:  # Peak
+        base_occupancy = (60 + r0 % 36) / 100
+    elif 10 <= departure_hour <= 16:  # Afternoon
+        base_occupancy = (30 + r0 % 41) / 100
+    else:  # Early morning/late night
+        base_occupancy = (10 + r0 % 41) / 100
+
+    # Weekend effect and route-popularity factor
+    weekend_factor = (85 + r1 % 31) / 100 if day_of_week >= 5 else 1.0
+    popularity_multiplier = (pop_lo + r2 % (pop_hi - pop_lo + 1)) / 100
+
+    occupancy_rate = min(
+        0.98, base_occupancy * popularity_multiplier * weekend_factor)
+    occupied_seats = int(total_seats * occupancy_rate)
+
+    # Introduce realistic data errors (2% chance)
+    if r3 % 100 < 2:
+        occupied_seats = total_seats + 1 + r4 % 5
+
+    # Apply realistic demand-based pricing
+    if occupancy_rate > 0.8:
+        demand_multiplier = (120 + r5 % 31) / 100
+    elif occupancy_rate < 0.3:
+        demand_multiplier = (80 + r5 % 16) / 100
+    else:
+        demand_multiplier = (95 + r5 % 26) / 100
+
+    fare = base_fare * demand_multiplier
+
+    # Introduce realistic anomalies for data quality testing (3% chance);
+    # type 3 is "duplicate_booking", which leaves the fare untouched
+    if r6 % 100 < 3:
+        anomaly_type = r7 % 4
+        if anomaly_type == 0:  # negative fare
+            fare = -float(100 + (r7 >> 2) % 401)
+        elif anomaly_type == 1:  # extreme high fare
+            fare = float(50000 + (r7 >> 2) % 150001)
+        elif anomaly_type == 2:  # zero fare
+            fare = 0.0
+
+    return occupied_seats, round(fare, 2)
+
 
 class BusDataSimulator:
     """Simulates bus schedule and seat occupancy data with Faker integration"""
@@ -100,43 +280,94 @@ class BusDataSimulator:
     def __init__(self, output_dir: str = "./data/raw", seed: int = None):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.seed = seed
 
-        # Initialize faker instance for this simulator
+        # Initialize faker instance for this simulator (kept for string
+        # fields that need realistic values: names, phones, companies)
         self.fake = Faker('en_IN')
         if seed:
             self.fake.seed_instance(seed)
 
-        # Add realistic Indian names and data
-        self.passenger_names = [fake.name() for _ in range(100)]
-        self.booking_agents = [fake.name() for _ in range(20)]
+        # Numeric randomness comes from a NumPy generator drawn in large
+        # batches: one C-level call fills a pool that thousands of
+        # per-record draws then consume, instead of going through Faker's
+        # Python-level provider dispatch for every number
+        self.rng = np.random.default_rng(seed)
+        self._pool = np.empty(0, dtype=np.uint64)
+        self._pool_index = 0
+
+        # Add realistic Indian names and data. Passenger fields come from
+        # pre-generated pools: Faker's provider-chain dispatch costs tens
+        # of microseconds per call, so paying it once up front and sampling
+        # with the batched RNG serves each record in nanoseconds. Pool
+        # sizes keep repeats rare within a run's sample data.
+        self.passenger_names = [self.fake.name() for _ in range(10_000)]
+        self.booking_agents = [self.fake.name() for _ in range(20)]
+        self._phone_pool = [self.fake.phone_number() for _ in range(10_000)]
+        # Fixed bothify templates are filled with batched NumPy draws
+        # rather than Faker's per-character template walker
+        self._booking_id_pool = _fill_template_pool(
+            self.rng, "BK###??###", 5_000)
+        self._bus_number_pool = _fill_template_pool(
+            self.rng, "??-####", 5_000)
+
+    _POOL_SIZE = 8192
+
+    def _rand_int(self, low: int, high: int) -> int:
+        """Uniform integer in [low, high] from the batched draw pool"""
+        if self._pool_index >= len(self._pool):
+            self._pool = self.rng.integers(
+                0, 1 << 62, size=self._POOL_SIZE, dtype=np.uint64)
+            self._pool_index = 0
+        value = int(self._pool[self._pool_index])
+        self._pool_index += 1
+        return low + value % (high - low + 1)
+
+    def _rand_bool(self, chance_of_getting_true: int) -> bool:
+        """Boolean with the given percentage chance of being True"""
+        return self._rand_int(1, 100) <= chance_of_getting_true
+
+    def _choice(self, elements):
+        """Uniform random element from a sequence"""
+        return elements[self._rand_int(0, len(elements) - 1)]
 
     def generate_schedule_id(self) -> int:
-        """Generate a unique schedule ID using Faker"""
-        # Use Faker's random number generator for more consistent results
-        return self.fake.random_int(min=100000, max=999999)
-
-    def simulate_schedule(self, record_date: datetime) -> Dict[str, Any]:
+        """Generate a unique schedule ID"""
+        return self._rand_int(100000, 999999)
+
+    def simulate_schedule(self, record_date: datetime,
+                          route: Dict[str, Any] = None,
+                          operator: Dict[str, Any] = None,
+                          departure_hour: int = None,
+                          departure_minute: int = None) -> Dict[str, Any]:
         """
         Simulate a bus schedule for a given date with enhanced realism
 
         Args:
             record_date: Date for which to generate schedule
+            route: Pre-selected route (drawn randomly when omitted)
+            operator: Pre-selected operator (drawn randomly when omitted)
+            departure_hour: Pre-drawn departure hour (sampled when omitted)
+            departure_minute: Pre-drawn departure minute (sampled when omitted)
 
         Returns:
             Dictionary containing schedule information
         """
-        route = self.fake.random_element(ROUTES)
-        operator = self.fake.random_element(OPERATORS)
-
-        # Generate departure time (6 AM to 11 PM) with realistic patterns
-        # More buses during popular hours
-        popular_hours = [7, 8, 9, 17, 18, 19, 20]
-        if self.fake.boolean(chance_of_getting_true=40):
-            departure_hour = self.fake.random_element(popular_hours)
-        else:
-            departure_hour = self.fake.random_int(min=6, max=23)
+        if route is None:
+            route = self._choice(ROUTES)
+        if operator is None:
+            operator = self._choice(OPERATORS)
+
+        # Generate departure time (6 AM to 11 PM) with realistic patterns:
+        # more buses during popular hours
+        if departure_hour is None:
+            if self._rand_bool(chance_of_getting_true=40):
+                departure_hour = self._choice(POPULAR_HOURS)
+            else:
+                departure_hour = self._rand_int(6, 23)
+        if departure_minute is None:
+            departure_minute = self._choice(DEPARTURE_MINUTES)
 
-        departure_minute = self.fake.random_element([0, 15, 30, 45])
         departure = record_date.replace(
             hour=departure_hour,
             minute=departure_minute,
@@ -144,19 +375,15 @@ class BusDataSimulator:
             microsecond=0
         )
 
-        # Calculate arrival time based on distance and realistic traffic conditions
-        base_speed = 55  # Average speed in km/h
-        # Adjust speed based on popularity (more traffic on popular routes)
-        if route["popularity"] == "high":
-            speed = self.fake.random_int(min=45, max=60)
-        elif route["popularity"] == "medium":
-            speed = self.fake.random_int(min=50, max=65)
-        else:
-            speed = self.fake.random_int(min=55, max=70)
+        # Calculate arrival time based on distance and realistic traffic
+        # conditions; the speed range is a lookup keyed by popularity.
+        # Time arithmetic runs on int epoch seconds: plain integer adds
+        # instead of timedelta/datetime allocations per schedule
+        speed = self._rand_int(*POPULARITY_SPEED_RANGE[route["popularity"]])
 
-        travel_hours = route["distance_km"] / speed
-        travel_duration = timedelta(hours=travel_hours)
-        arrival = departure + travel_duration
+        departure_epoch = int(departure.timestamp())
+        travel_seconds = int(route["distance_km"] / speed * 3600)
+        arrival_epoch = departure_epoch + travel_seconds
 
         schedule_id = self.generate_schedule_id()
 
@@ -164,25 +391,27 @@ class BusDataSimulator:
         # Indian bus number format: State code + district number + letters + numbers
         state_codes = ["MH", "DL", "KA", "TN",
                        "WB", "RJ", "GJ", "KL", "AP", "TS"]
-        state_code = self.fake.random_element(state_codes)
-        bus_number = f"{state_code}-{self.fake.random_int(min=10, max=99)}-{self.fake.bothify(text='??-####')}"
-        conductor_name = self.fake.random_element(self.booking_agents)
+        state_code = self._choice(state_codes)
+        bus_number = f"{state_code}-{self._rand_int(10, 99)}-{self._choice(self._bus_number_pool)}"
+        conductor_name = self._choice(self.booking_agents)
 
         return {
+            # Parsed departure kept alongside the ISO string so consumers
+            # don't re-parse it; stripped before JSON emit
+            "_departure_dt": departure,
+            "_departure_epoch": departure_epoch,
             "schedule_id": schedule_id,
             "route_id": route["route_id"],
             "operator_id": operator["operator_id"],
             "departure_time": departure.isoformat(),
-            "arrival_time": arrival.isoformat(),
+            "arrival_time": _iso(arrival_epoch),
             "date": record_date.date().isoformat(),
             "bus_number": bus_number,
             "conductor_name": conductor_name,
-            "route_info": {
-                "origin": route["origin"],
-                "destination": route["destination"],
-                "distance_km": route["distance_km"],
-                "popularity": route["popularity"]
-            }
+            # Full route row carried for occupancy simulation; stripped
+            # before emit — downstream joins routes_metadata.json on
+            # route_id instead of a nested copy in every schedule
+            "_route": route
         }
 
     def calculate_base_fare(self, distance_km: float, seat_type: str) -> float:
@@ -196,144 +425,90 @@ class BusDataSimulator:
         Returns:
             Base fare amount
         """
-        # Realistic Indian bus fare structure with Faker
-        if distance_km < 200:  # Short routes
-            rate_per_km = self.fake.random_int(
-                min=25, max=35) / 10  # ₹2.5-3.5 per km
-        elif distance_km < 400:  # Medium routes
-            rate_per_km = self.fake.random_int(
-                min=20, max=30) / 10  # ₹2.0-3.0 per km
-        else:  # Long routes
-            rate_per_km = self.fake.random_int(
-                min=15, max=25) / 10  # ₹1.5-2.5 per km
-
-        # Add realistic base fare with minimum fare logic
-        base_fare = max(50, distance_km * rate_per_km)  # Minimum ₹50 fare
-
-        # Apply seat type multiplier
-        seat_multiplier = SEAT_TYPES[seat_type]["base_fare_multiplier"]
-
-        # Add realistic variance (±10%)
-        variance = self.fake.random_int(min=90, max=110) / 100
-
-        final_fare = base_fare * seat_multiplier * variance
-
-        return round(final_fare, 2)
+        return _base_fare_kernel(
+            distance_km,
+            SEAT_TYPES[seat_type]["base_fare_multiplier"],
+            self._rand_int(0, (1 << 32) - 1),
+            self._rand_int(0, (1 << 32) - 1)
+        )
 
-    def simulate_seat_occupancy(self, schedule: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def simulate_seat_occupancy(self, schedule: Dict[str, Any],
+                                now_iso: str = None) -> List[Dict[str, Any]]:
         """
         Simulate seat occupancy data for a schedule with enhanced realism
 
         Args:
             schedule: Schedule information
+            now_iso: Pre-formatted generation timestamp (computed when
+                omitted); batch callers pass one value for the whole run
 
         Returns:
             List of seat occupancy records with passenger details
         """
+        if now_iso is None:
+            now_iso = datetime.now(timezone.utc).isoformat()
         occupancy_records = []
         schedule_id = schedule["schedule_id"]
-        distance_km = schedule["route_info"]["distance_km"]
-        route_popularity = schedule["route_info"]["popularity"]
+        route = schedule.get("_route") or ROUTES_BY_ID[schedule["route_id"]]
+        distance_km = route["distance_km"]
+        route_popularity = route["popularity"]
+
+        # Departure datetime is invariant across seat types: parse it once
+        # here (or reuse the pre-parsed value) instead of per iteration
+        departure_dt = schedule.get("_departure_dt") or datetime.fromisoformat(
+            schedule["departure_time"])
+        departure_hour = departure_dt.hour
+        day_of_week = departure_dt.weekday()
+        departure_epoch = schedule.get(
+            "_departure_epoch") or int(departure_dt.timestamp())
 
         # Simulate for 2-3 seat types per bus (more realistic)
-        num_seat_types = self.fake.random_int(min=2, max=3)
-        selected_seat_types = self.fake.random_elements(
-            elements=list(SEAT_TYPES.keys()),
-            length=num_seat_types,
-            unique=True
-        )
+        if self._rand_bool(chance_of_getting_true=50):
+            selected_seat_types = SEAT_TYPE_NAMES
+        else:
+            # Two distinct types: drop one uniformly at random
+            selected_seat_types = SEAT_TYPE_PAIRS[
+                self._rand_int(0, len(SEAT_TYPE_NAMES) - 1)]
+
+        pop_lo, pop_hi = POPULARITY_OCCUPANCY_RANGE[route_popularity]
 
         for seat_type in selected_seat_types:
             # Get typical seat count with some variation
             typical_count = SEAT_TYPES[seat_type]["typical_count"]
-            total_seats = self.fake.random_int(
-                min=max(10, typical_count - 10),
-                max=typical_count + 10
+            total_seats = self._rand_int(
+                max(10, typical_count - 10),
+                typical_count + 10
             )
 
-            # Simulate occupancy based on multiple realistic factors
-            departure_hour = datetime.fromisoformat(
-                schedule["departure_time"]).hour
-
-            # Base occupancy by time of day
-            if departure_hour in [7, 8, 9, 17, 18, 19]:  # Peak hours
-                base_occupancy = self.fake.random_int(min=60, max=95) / 100
-            elif departure_hour in [10, 11, 12, 13, 14, 15, 16]:  # Afternoon
-                base_occupancy = self.fake.random_int(min=30, max=70) / 100
-            else:  # Early morning/late night
-                base_occupancy = self.fake.random_int(min=10, max=50) / 100
-
-            # Adjust for route popularity
-            popularity_multiplier = {
-                "high": self.fake.random_int(min=110, max=130) / 100,
-                "medium": self.fake.random_int(min=90, max=110) / 100,
-                "low": self.fake.random_int(min=70, max=90) / 100
-            }
-
-            # Apply day-of-week effect (weekends might be different)
-            day_of_week = datetime.fromisoformat(
-                schedule["departure_time"]).weekday()
-            if day_of_week >= 5:  # Weekend
-                weekend_factor = self.fake.random_int(min=85, max=115) / 100
-            else:
-                weekend_factor = 1.0
-
-            occupancy_rate = min(
-                0.98, base_occupancy * popularity_multiplier[route_popularity] * weekend_factor)
-            occupied_seats = int(total_seats * occupancy_rate)
-
-            # Introduce realistic data errors (2% chance)
-            if self.fake.boolean(chance_of_getting_true=2):
-                occupied_seats = total_seats + \
-                    self.fake.random_int(min=1, max=5)
-
             # Calculate fare with enhanced realism
             base_fare = self.calculate_base_fare(distance_km, seat_type)
 
-            # Apply realistic demand-based pricing
-            if occupancy_rate > 0.8:
-                demand_multiplier = self.fake.random_int(
-                    min=120, max=150) / 100
-            elif occupancy_rate < 0.3:
-                demand_multiplier = self.fake.random_int(min=80, max=95) / 100
-            else:
-                demand_multiplier = self.fake.random_int(min=95, max=120) / 100
-
-            fare = base_fare * demand_multiplier
-
-            # Introduce realistic anomalies for data quality testing (3% chance)
-            if self.fake.boolean(chance_of_getting_true=3):
-                anomaly_type = self.fake.random_element([
-                    "negative_fare", "extreme_high_fare", "zero_fare", "duplicate_booking"
-                ])
-                if anomaly_type == "negative_fare":
-                    fare = -self.fake.random_int(min=100, max=500)
-                elif anomaly_type == "extreme_high_fare":
-                    fare = self.fake.random_int(min=50000, max=200000)
-                elif anomaly_type == "zero_fare":
-                    fare = 0
-
-            fare = round(fare, 2)
+            # All remaining numerics run in the module-level kernel over
+            # eight raw pool draws
+            occupied_seats, fare = _occupancy_kernel(
+                total_seats, base_fare, departure_hour, day_of_week,
+                pop_lo, pop_hi,
+                *(self._rand_int(0, (1 << 62) - 1) for _ in range(8))
+            )
 
             # Create realistic timestamp with Faker
-            base_timestamp = datetime.fromisoformat(schedule["departure_time"])
-            timestamp_offset = self.fake.random_int(
-                min=-180, max=60)  # 3 hours before to 1 hour after
-            timestamp = base_timestamp + timedelta(minutes=timestamp_offset)
+            timestamp_offset = self._rand_int(
+                -180, 60)  # 3 hours before to 1 hour after
+            timestamp_epoch = departure_epoch + timestamp_offset * 60
 
             # Add realistic booking and passenger details
-            booking_agent = self.fake.random_element(self.booking_agents)
+            booking_agent = self._choice(self.booking_agents)
 
             # Generate realistic passenger demographics for occupied seats
             passengers = []
             # Sample of passengers (max 5 for demo)
             for _ in range(min(occupied_seats, 5)):
                 passenger = {
-                    "name": self.fake.name(),
-                    "age": self.fake.random_int(min=18, max=75),
-                    "gender": self.fake.random_element(["Male", "Female"]),
-                    "phone": self.fake.phone_number(),
-                    "booking_id": self.fake.bothify(text="BK###??###")
+                    "name": self._choice(self.passenger_names),
+                    "age": self._rand_int(18, 75),
+                    "gender": self._choice(["Male", "Female"]),
+                    "phone": self._choice(self._phone_pool),
+                    "booking_id": self._choice(self._booking_id_pool)
                 }
                 passengers.append(passenger)
 
@@ -343,69 +518,177 @@ class BusDataSimulator:
                 "total_seats": total_seats,
                 "occupied_seats": occupied_seats,
                 "fare": fare,
-                "timestamp": timestamp.isoformat(),
+                "timestamp": _iso(timestamp_epoch),
                 "occupancy_rate": round(occupied_seats / total_seats, 3) if total_seats > 0 else 0,
                 "booking_agent": booking_agent,
-                "payment_method": self.fake.random_element(["cash", "card", "upi", "wallet"]),
-                "booking_source": self.fake.random_element(["online", "counter", "mobile_app", "agent"]),
+                "payment_method": self._choice(["cash", "card", "upi", "wallet"]),
+                "booking_source": self._choice(["online", "counter", "mobile_app", "agent"]),
                 "passenger_sample": passengers,  # Sample passenger data for realism
                 "revenue": round(fare * occupied_seats, 2),
-                "last_updated": datetime.utcnow().isoformat()
+                "last_updated": now_iso
             }
 
             occupancy_records.append(occupancy_record)
 
         return occupancy_records
 
-    def generate_data_for_date_range(self, start_date: datetime, num_days: int = 7, schedules_per_day: int = 15):
+    def _write_parquet(self, path: Path, records: List[Dict[str, Any]]) -> None:
+        """Write records as a zstd-compressed Parquet file
+
+        Low-cardinality string columns (seat_type, payment_method,
+        booking_source) get dictionary encoding; nested passenger_sample
+        dicts become a list-of-struct column.
         """
-        Generate simulation data for a range of dates
+        table = pa.Table.from_pylist(records)
+        dict_columns = [
+            column for column in
+            ("seat_type", "payment_method", "booking_source")
+            if column in table.column_names
+        ]
+        pq.write_table(table, path, compression="zstd",
+                       use_dictionary=dict_columns or True)
+
+    def generate_day(self, current_date: datetime, schedules_per_day: int = 15,
+                     output_format: str = "json") -> Tuple[int, int]:
+        """
+        Generate and save one day's schedules and occupancy records
 
         Args:
-            start_date: Starting date for simulation
-            num_days: Number of days to simulate
-            schedules_per_day: Number of schedules to generate per day
-        """
-        logger.info(
-            f"Starting data simulation for {num_days} days, {schedules_per_day} schedules per day")
+            current_date: Date to generate data for
+            schedules_per_day: Number of schedules to generate
+            output_format: "json" (default) or "parquet"
 
-        total_schedules = 0
-        total_occupancy_records = 0
+        Returns:
+            Tuple of (schedules generated, occupancy records generated)
+        """
+        if output_format == "parquet" and pa is None:
+            raise RuntimeError(
+                "pyarrow is required for parquet output; install it or use "
+                "output_format='json'")
+        logger.info(f"Generating data for {current_date.date()}")
 
-        for day_offset in range(num_days):
-            current_date = start_date + timedelta(days=day_offset)
-            logger.info(f"Generating data for {current_date.date()}")
+        date_str = current_date.strftime("%Y%m%d")
+        records = self._day_records(current_date, schedules_per_day)
 
+        if output_format == "parquet":
+            # Parquet needs the whole day resident for the columnar write
             day_schedules = []
             day_occupancy = []
-
-            for _ in range(schedules_per_day):
-                # Generate schedule
-                schedule = self.simulate_schedule(current_date)
+            for schedule, occupancy_records in records:
                 day_schedules.append(schedule)
-
-                # Generate seat occupancy for this schedule
-                occupancy_records = self.simulate_seat_occupancy(schedule)
                 day_occupancy.extend(occupancy_records)
+            self._write_parquet(
+                self.output_dir / f"schedules_{date_str}.parquet",
+                day_schedules)
+            self._write_parquet(
+                self.output_dir / f"occupancy_{date_str}.parquet",
+                day_occupancy)
+            n_schedules = len(day_schedules)
+            n_occupancy = len(day_occupancy)
+        else:
+            # Stream newline-delimited JSON, one record per line: Spark
+            # can split NDJSON files across tasks and skip the whole-file
+            # multiline parse, and peak memory here stays flat regardless
+            # of schedules_per_day
+            schedules_file = self.output_dir / f"schedules_{date_str}.json"
+            occupancy_file = self.output_dir / f"occupancy_{date_str}.json"
+            n_schedules = 0
+            n_occupancy = 0
+            with open(schedules_file, "wb") as sf, \
+                    open(occupancy_file, "wb") as of:
+                for schedule, occupancy_records in records:
+                    sf.write(_dumps(schedule))
+                    sf.write(b"\n")
+                    for record in occupancy_records:
+                        of.write(_dumps(record))
+                        of.write(b"\n")
+                    n_schedules += 1
+                    n_occupancy += len(occupancy_records)
 
-                total_schedules += 1
-                total_occupancy_records += len(occupancy_records)
+        logger.info(
+            f"Saved {n_schedules} schedules and {n_occupancy} occupancy records for {current_date.date()}")
 
-            # Save daily data to files
-            date_str = current_date.strftime("%Y%m%d")
+        return n_schedules, n_occupancy
 
-            # Save schedules
-            schedules_file = self.output_dir / f"schedules_{date_str}.json"
-            with open(schedules_file, 'w') as f:
-                json.dump({"schedules": day_schedules}, f, indent=2)
+    def _day_records(self, current_date: datetime, schedules_per_day: int):
+        """Yield one day's (schedule, occupancy records) pairs
 
-            # Save occupancy data
-            occupancy_file = self.output_dir / f"occupancy_{date_str}.json"
-            with open(occupancy_file, 'w') as f:
-                json.dump({"occupancy_records": day_occupancy}, f, indent=2)
+        A generator so emit paths can stream records to disk without
+        holding the full day in memory.
+        """
+        # One clock read and format for the whole day's records
+        now_iso = datetime.now(timezone.utc).isoformat()
+
+        # Pick the day's routes and operators with one bulk draw each
+        # instead of one RNG call per schedule
+        route_idxs = self.rng.integers(
+            0, len(ROUTES), size=schedules_per_day)
+        operator_idxs = self.rng.integers(
+            0, len(OPERATORS), size=schedules_per_day)
+
+        # Vectorized departure sampling: a mixture mask plus two bulk
+        # draws replace two RNG calls per schedule
+        popular_mask = self.rng.random(schedules_per_day) < 0.4
+        departure_hours = np.where(
+            popular_mask,
+            self.rng.choice(POPULAR_HOURS, size=schedules_per_day),
+            self.rng.integers(6, 24, size=schedules_per_day)
+        )
+        departure_minutes = self.rng.choice(
+            DEPARTURE_MINUTES, size=schedules_per_day)
+
+        for i in range(schedules_per_day):
+            # Generate schedule
+            schedule = self.simulate_schedule(
+                current_date,
+                route=ROUTES[route_idxs[i]],
+                operator=OPERATORS[operator_idxs[i]],
+                departure_hour=int(departure_hours[i]),
+                departure_minute=int(departure_minutes[i])
+            )
+
+            # Generate seat occupancy for this schedule
+            occupancy_records = self.simulate_seat_occupancy(
+                schedule, now_iso)
+            schedule.pop("_departure_dt", None)
+            schedule.pop("_departure_epoch", None)
+            schedule.pop("_route", None)
+            yield schedule, occupancy_records
+
+    def generate_data_for_date_range(self, start_date: datetime, num_days: int = 7,
+                                     schedules_per_day: int = 15,
+                                     output_format: str = "json"):
+        """
+        Generate simulation data for a range of dates
+
+        Days are independent (separate files, separate per-day RNG state),
+        so multi-day runs fan out across processes: one task per day,
+        seeded deterministically as seed + day_offset, which sidesteps the
+        GIL entirely. Single-day runs stay in-process.
+
+        Args:
+            start_date: Starting date for simulation
+            num_days: Number of days to simulate
+            schedules_per_day: Number of schedules to generate per day
+            output_format: "json" (default) or "parquet"
+        """
+        logger.info(
+            f"Starting data simulation for {num_days} days, {schedules_per_day} schedules per day")
 
-            logger.info(
-                f"Saved {len(day_schedules)} schedules and {len(day_occupancy)} occupancy records for {current_date.date()}")
+        if num_days > 1:
+            day_args = [
+                (str(self.output_dir), self.seed, start_date.isoformat(),
+                 day_offset, schedules_per_day, output_format)
+                for day_offset in range(num_days)
+            ]
+            with ProcessPoolExecutor() as executor:
+                results = list(executor.map(_generate_one_day, day_args))
+        else:
+            results = [self.generate_day(
+                start_date, schedules_per_day, output_format)]
+
+        total_schedules = sum(n_sched for n_sched, _ in results)
+        total_occupancy_records = sum(n_occ for _, n_occ in results)
 
         logger.info(f"Data simulation complete!")
         logger.info(f"Total schedules generated: {total_schedules}")
@@ -417,18 +700,31 @@ class BusDataSimulator:
         """Generate static metadata files for routes and operators"""
         # Save routes metadata
         routes_file = self.output_dir / "routes_metadata.json"
-        with open(routes_file, 'w') as f:
-            json.dump({"routes": ROUTES}, f, indent=2)
+        _dump_json(routes_file, {"routes": ROUTES})
 
         # Save operators metadata
         operators_file = self.output_dir / "operators_metadata.json"
-        with open(operators_file, 'w') as f:
-            json.dump({"operators": OPERATORS}, f, indent=2)
+        _dump_json(operators_file, {"operators": OPERATORS})
 
         logger.info(
             "Metadata files generated: routes_metadata.json, operators_metadata.json")
 
 
+def _generate_one_day(args: Tuple[str, int, str, int, int, str]) -> Tuple[int, int]:
+    """Worker for one day's generation in a separate process
+
+    Top-level (picklable) so ProcessPoolExecutor can ship it to workers.
+    Each worker builds its own simulator seeded seed + day_offset, keeping
+    output deterministic regardless of worker scheduling.
+    """
+    output_dir, seed, start_iso, day_offset, schedules_per_day, output_format = args
+    simulator = BusDataSimulator(
+        output_dir, seed=(seed + day_offset) if seed is not None else None)
+    current_date = datetime.fromisoformat(start_iso) + \
+        timedelta(days=day_offset)
+    return simulator.generate_day(current_date, schedules_per_day, output_format)
+
+
 def main():
     """Main function to run the enhanced data simulation with Faker"""
     # Configuration
@@ -318,6 +318,45 @@ class BusDataScheduler:
         except Exception as e:
             logger.error(f"Failed to generate data freshness report: {e}")
 
+    def maintain_db_partitions(self):
+        """Pre-create upcoming time partitions and drop expired ones
+
+        No-op unless sql/partitioning.sql has been applied; the
+        maintain_time_partitions() function only exists on partitioned
+        deployments.
+        """
+        logger.info("Running partition maintenance...")
+
+        try:
+            retention_months = int(
+                os.getenv("PARTITION_RETENTION_MONTHS", "12"))
+
+            connection = psycopg2.connect(
+                host=self.db_host,
+                port=self.db_port,
+                database=self.db_name,
+                user=self.db_user,
+                password=self.db_password,
+                connect_timeout=10
+            )
+
+            cursor = connection.cursor()
+            cursor.execute(
+                "SELECT 1 FROM pg_proc WHERE proname = 'maintain_time_partitions'")
+            if cursor.fetchone():
+                cursor.execute(
+                    "SELECT maintain_time_partitions(%s)", (retention_months,))
+                connection.commit()
+                logger.info("Partition maintenance completed")
+            else:
+                logger.debug(
+                    "Partitioning not enabled, skipping partition maintenance")
+            cursor.close()
+            connection.close()
+
+        except Exception as e:
+            logger.error(f"Partition maintenance failed: {e}")
+
     def health_check_job(self):
         """Comprehensive system health check"""
         logger.debug("Running system health check...")
@@ -394,6 +433,15 @@ class BusDataScheduler:
             max_instances=1
         )
 
+        # Partition maintenance - runs nightly at 1:30 AM (before cleanup)
+        self.scheduler.add_job(
+            func=self.maintain_db_partitions,
+            trigger=CronTrigger(hour=1, minute=30),
+            id="partition_maintenance",
+            name="Partition Maintenance",
+            max_instances=1
+        )
+
         # Health check - runs every 5 minutes
         self.scheduler.add_job(
             func=self.health_check_job,
@@ -408,6 +456,7 @@ class BusDataScheduler:
         logger.info(f"  - ETL Job: every {self.etl_interval_seconds} seconds")
         logger.info(f"  - Data Simulation: every 30 minutes")
         logger.info(f"  - Cleanup: daily at 2 AM")
+        logger.info(f"  - Partition Maintenance: daily at 1:30 AM")
         logger.info(f"  - Freshness Report: every 4 hours")
         logger.info(
             f"  - Health Check: every {self.health_check_interval_minutes} minutes")
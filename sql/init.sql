@@ -12,25 +12,37 @@ CREATE INDEX IF NOT EXISTS idx_routes_origin_destination ON routes(origin, desti
 
 -- Operators table indexes  
 CREATE INDEX IF NOT EXISTS idx_operators_name ON operators(name);
-CREATE INDEX IF NOT EXISTS idx_operators_active ON operators(is_active);
+-- A B-tree on a near-constant boolean never beats a seq scan; dropped
+DROP INDEX IF EXISTS idx_operators_active;
 
 -- Schedules table indexes
-CREATE INDEX IF NOT EXISTS idx_schedules_route_id ON schedules(route_id);
+-- The composite (route_id, date) index serves the hot schedule lookup and
+-- supersedes separate single-column route_id/date indexes
 CREATE INDEX IF NOT EXISTS idx_schedules_operator_id ON schedules(operator_id);
-CREATE INDEX IF NOT EXISTS idx_schedules_date ON schedules(date);
 CREATE INDEX IF NOT EXISTS idx_schedules_departure_time ON schedules(departure_time);
-CREATE INDEX IF NOT EXISTS idx_schedules_route_date ON schedules(route_id, date);
-CREATE INDEX IF NOT EXISTS idx_schedules_active ON schedules(is_active);
+CREATE INDEX IF NOT EXISTS ix_schedules_route_date ON schedules(route_id, date);
+-- Partial index over active schedules replaces the full boolean index
+CREATE INDEX IF NOT EXISTS ix_schedule_active ON schedules(departure_time) WHERE is_active;
+DROP INDEX IF EXISTS idx_schedules_active;
+DROP INDEX IF EXISTS idx_schedules_route_id;
+DROP INDEX IF EXISTS idx_schedules_date;
+DROP INDEX IF EXISTS idx_schedules_route_date;
 
 -- Seat occupancy table indexes
-CREATE INDEX IF NOT EXISTS idx_seat_occupancy_schedule_id ON seat_occupancy(schedule_id);
-CREATE INDEX IF NOT EXISTS idx_seat_occupancy_seat_type ON seat_occupancy(seat_type);
-CREATE INDEX IF NOT EXISTS idx_seat_occupancy_timestamp ON seat_occupancy(timestamp);
+-- Covering index for the (schedule_id, seat_type, timestamp) access
+-- pattern; INCLUDE columns enable index-only scans for the stats queries
+CREATE INDEX IF NOT EXISTS ix_so_sched_type_ts ON seat_occupancy(schedule_id, seat_type, timestamp)
+    INCLUDE (occupancy_rate, fare, total_seats, occupied_seats);
 CREATE INDEX IF NOT EXISTS idx_seat_occupancy_created_at ON seat_occupancy(created_at);
-CREATE INDEX IF NOT EXISTS idx_seat_occupancy_schedule_seat_type ON seat_occupancy(schedule_id, seat_type);
+DROP INDEX IF EXISTS idx_seat_occupancy_schedule_id;
+DROP INDEX IF EXISTS idx_seat_occupancy_seat_type;
+DROP INDEX IF EXISTS idx_seat_occupancy_timestamp;
+DROP INDEX IF EXISTS idx_seat_occupancy_schedule_seat_type;
 
 -- Data quality log indexes
 CREATE INDEX IF NOT EXISTS idx_data_quality_log_issue_type ON data_quality_log(issue_type);
+CREATE INDEX IF NOT EXISTS ix_dql_unresolved_critical ON data_quality_log(detected_at)
+    WHERE not resolved AND severity = 'critical';
 CREATE INDEX IF NOT EXISTS idx_data_quality_log_timestamp ON data_quality_log(timestamp);
 CREATE INDEX IF NOT EXISTS idx_data_quality_log_record_id ON data_quality_log(record_id);
 
@@ -47,6 +59,10 @@ ALTER TABLE seat_occupancy ADD CONSTRAINT chk_seat_occupancy_fare_positive
 ALTER TABLE seat_occupancy ADD CONSTRAINT chk_seat_occupancy_seats_non_negative 
     CHECK (total_seats >= 0 AND occupied_seats >= 0);
 
+-- Ensure occupied seats never exceed capacity
+ALTER TABLE seat_occupancy ADD CONSTRAINT ck_so_occupied_le_total
+    CHECK (occupied_seats <= total_seats);
+
 -- Ensure occupancy rate is between 0 and 1
 ALTER TABLE seat_occupancy ADD CONSTRAINT chk_seat_occupancy_rate_valid 
     CHECK (occupancy_rate >= 0 AND occupancy_rate <= 1);
@@ -168,23 +184,44 @@ INSERT INTO operators (operator_id, name, contact_email, is_active) VALUES
 (6, 'TSRTC', 'contact@tsrtc.telangana.gov.in', true)
 ON CONFLICT (operator_id) DO NOTHING;
 
--- Create a trigger to automatically update occupancy_rate when seat data changes
-CREATE OR REPLACE FUNCTION update_occupancy_rate()
+-- Maintain updated_at in the database rather than via ORM onupdate,
+-- so bulk UPDATEs stay batchable and every writer gets consistent stamps
+CREATE OR REPLACE FUNCTION touch_updated_at()
 RETURNS TRIGGER AS $$
 BEGIN
-    IF NEW.total_seats > 0 THEN
-        NEW.occupancy_rate := LEAST(1.0, NEW.occupied_seats::DECIMAL / NEW.total_seats);
-    ELSE
-        NEW.occupancy_rate := 0;
-    END IF;
+    NEW.updated_at := NOW();
     RETURN NEW;
 END;
 $$ LANGUAGE plpgsql;
 
-CREATE TRIGGER trigger_update_occupancy_rate
-    BEFORE INSERT OR UPDATE ON seat_occupancy
+DROP TRIGGER IF EXISTS set_updated_at ON routes;
+CREATE TRIGGER set_updated_at
+    BEFORE UPDATE ON routes
     FOR EACH ROW
-    EXECUTE FUNCTION update_occupancy_rate();
+    EXECUTE FUNCTION touch_updated_at();
+
+DROP TRIGGER IF EXISTS set_updated_at ON operators;
+CREATE TRIGGER set_updated_at
+    BEFORE UPDATE ON operators
+    FOR EACH ROW
+    EXECUTE FUNCTION touch_updated_at();
+
+DROP TRIGGER IF EXISTS set_updated_at ON schedules;
+CREATE TRIGGER set_updated_at
+    BEFORE UPDATE ON schedules
+    FOR EACH ROW
+    EXECUTE FUNCTION touch_updated_at();
+
+DROP TRIGGER IF EXISTS set_updated_at ON seat_occupancy;
+CREATE TRIGGER set_updated_at
+    BEFORE UPDATE ON seat_occupancy
+    FOR EACH ROW
+    EXECUTE FUNCTION touch_updated_at();
+
+-- occupancy_rate is a stored GENERATED column (see api/models.py), so the
+-- old maintenance trigger is no longer needed
+DROP TRIGGER IF EXISTS trigger_update_occupancy_rate ON seat_occupancy;
+DROP FUNCTION IF EXISTS update_occupancy_rate();
 
 -- Grant necessary permissions for the application user
 -- Note: This assumes the application connects with the same user as specified in env vars
@@ -0,0 +1,214 @@
+-- Bus Pricing Pipeline Time-Series Partitioning (opt-in)
+-- Converts the append-only time-series tables to monthly PostgreSQL range
+-- partitions. Range partitioning gives the stats endpoints partition
+-- pruning on their date filters, keeps index working sets small, and
+-- makes retention a cheap DROP TABLE instead of a bulk DELETE.
+--
+-- Run once after the base tables exist (after init.sql). The scheduler
+-- service then calls maintain_time_partitions() nightly to pre-create the
+-- next month's partitions and drop partitions past retention.
+--
+-- Partitioned tables and their partition keys:
+--   seat_occupancy        -> timestamp
+--   pricing_model_results -> calculation_timestamp
+--   system_health         -> checked_at
+--   data_quality_log      -> detected_at
+
+-- Create one monthly child partition of a parent table if it is missing
+CREATE OR REPLACE FUNCTION create_month_partition(parent_table text, month_start date)
+RETURNS void AS $$
+DECLARE
+    partition_name text := parent_table || '_' || to_char(month_start, 'YYYY_MM');
+    default_name text := parent_table || '_default';
+    month_end date := (month_start + INTERVAL '1 month')::date;
+    ts_column text;
+    insert_cols text;
+    has_default_rows boolean := false;
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_class WHERE relname = partition_name) THEN
+        RETURN;
+    END IF;
+
+    -- PostgreSQL refuses to create a partition whose range overlaps
+    -- rows sitting in the DEFAULT partition (backfill gaps, scheduler
+    -- downtime), so park those rows first and re-route them through
+    -- the parent once the partition exists. All within this function's
+    -- transaction, so the rows are never visible as missing.
+    IF EXISTS (SELECT 1 FROM pg_class WHERE relname = default_name) THEN
+        SELECT a.attname INTO ts_column
+          FROM pg_partitioned_table pt
+          JOIN pg_attribute a
+            ON a.attrelid = pt.partrelid AND a.attnum = pt.partattrs[0]
+         WHERE pt.partrelid = parent_table::regclass;
+        SELECT string_agg(quote_ident(attname), ', ' ORDER BY attnum)
+          INTO insert_cols
+          FROM pg_attribute
+         WHERE attrelid = parent_table::regclass
+           AND attnum > 0 AND NOT attisdropped AND attgenerated = '';
+
+        EXECUTE format(
+            'SELECT EXISTS (SELECT 1 FROM %I WHERE %I >= %L AND %I < %L)',
+            default_name, ts_column, month_start, ts_column, month_end
+        ) INTO has_default_rows;
+        IF has_default_rows THEN
+            EXECUTE format(
+                'CREATE TEMP TABLE pending_partition_rows AS
+                 SELECT %s FROM %I WHERE %I >= %L AND %I < %L',
+                insert_cols, default_name,
+                ts_column, month_start, ts_column, month_end
+            );
+            EXECUTE format(
+                'DELETE FROM %I WHERE %I >= %L AND %I < %L',
+                default_name, ts_column, month_start, ts_column, month_end
+            );
+        END IF;
+    END IF;
+
+    EXECUTE format(
+        'CREATE TABLE %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L)',
+        partition_name,
+        parent_table,
+        month_start,
+        month_end
+    );
+
+    IF has_default_rows THEN
+        EXECUTE format(
+            'INSERT INTO %I (%s) SELECT %s FROM pending_partition_rows',
+            parent_table, insert_cols, insert_cols
+        );
+        DROP TABLE pending_partition_rows;
+    END IF;
+
+    RAISE NOTICE 'Created partition %', partition_name;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Convert an existing regular table to a range-partitioned parent.
+-- Existing rows land in a DEFAULT partition so the conversion needs no
+-- downtime window for backfilling; new monthly partitions pick up rows
+-- going forward. Idempotent: skips tables that are already partitioned.
+CREATE OR REPLACE FUNCTION convert_to_time_partitioned(table_name text, ts_column text)
+RETURNS void AS $$
+DECLARE
+    old_table text := table_name || '_unpartitioned';
+    id_seq text;
+    insert_cols text;
+    idx_defs text[];
+    idx_def text;
+    month_start date;
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_class WHERE relname = table_name AND relkind = 'p') THEN
+        RAISE NOTICE 'Table % is already partitioned, skipping', table_name;
+        RETURN;
+    END IF;
+
+    -- Captured up front, before the rename:
+    -- the id sequence (still owned by the old table after the rename),
+    id_seq := pg_get_serial_sequence(table_name, 'id');
+    -- the column list minus generated columns, which cannot be INSERT
+    -- targets during the backfill,
+    SELECT string_agg(quote_ident(attname), ', ' ORDER BY attnum)
+      INTO insert_cols
+      FROM pg_attribute
+     WHERE attrelid = table_name::regclass
+       AND attnum > 0 AND NOT attisdropped AND attgenerated = '';
+    -- and the secondary index definitions. The primary key is rebuilt
+    -- below (partitioned unique indexes must include the partition
+    -- column), so unique indexes are skipped here.
+    SELECT array_agg(indexdef)
+      INTO idx_defs
+      FROM pg_indexes
+     WHERE schemaname = current_schema()
+       AND tablename = table_name
+       AND indexdef NOT LIKE 'CREATE UNIQUE INDEX%';
+
+    EXECUTE format('ALTER TABLE %I RENAME TO %I', table_name, old_table);
+    -- INCLUDING GENERATED keeps seat_occupancy.occupancy_rate a
+    -- database-computed column; without it every post-conversion row
+    -- would carry NULL since the writers no longer populate it
+    EXECUTE format(
+        'CREATE TABLE %I (LIKE %I INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING GENERATED) PARTITION BY RANGE (%I)',
+        table_name, old_table, ts_column
+    );
+    -- Re-own the id sequence: the copied nextval() default references
+    -- it, and while the old table owns it the final DROP TABLE fails
+    -- on that dependency
+    IF id_seq IS NOT NULL THEN
+        EXECUTE format('ALTER SEQUENCE %s OWNED BY %I.id', id_seq, table_name);
+    END IF;
+    -- Partitioned primary keys must include the partition column
+    EXECUTE format('ALTER TABLE %I ADD PRIMARY KEY (id, %I)', table_name, ts_column);
+    EXECUTE format('CREATE TABLE %I PARTITION OF %I DEFAULT',
+                   table_name || '_default', table_name);
+    -- Pre-create a real partition for every month present in the data
+    -- so the backfill routes rows into them, not into the default -
+    -- rows stranded there would block every later create_month_partition
+    -- for their month
+    FOR month_start IN
+        EXECUTE format(
+            'SELECT DISTINCT date_trunc(''month'', %I)::date FROM %I WHERE %I IS NOT NULL',
+            ts_column, old_table, ts_column)
+    LOOP
+        PERFORM create_month_partition(table_name, month_start);
+    END LOOP;
+    EXECUTE format('INSERT INTO %I (%s) SELECT %s FROM %I',
+                   table_name, insert_cols, insert_cols, old_table);
+    EXECUTE format('DROP TABLE %I', old_table);
+    -- Recreate the secondary indexes (covering, partial) on the parent;
+    -- their names are free again now that the old table is gone
+    IF idx_defs IS NOT NULL THEN
+        FOREACH idx_def IN ARRAY idx_defs LOOP
+            EXECUTE idx_def;
+        END LOOP;
+    END IF;
+    RAISE NOTICE 'Converted % to monthly range partitioning on %', table_name, ts_column;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Nightly maintenance: ensure partitions exist for the current and next
+-- month, and drop monthly partitions older than the retention window.
+CREATE OR REPLACE FUNCTION maintain_time_partitions(retention_months int DEFAULT 12)
+RETURNS void AS $$
+DECLARE
+    parent record;
+    child record;
+    this_month date := date_trunc('month', CURRENT_DATE)::date;
+    cutoff date := (date_trunc('month', CURRENT_DATE) - make_interval(months => retention_months))::date;
+    child_month date;
+BEGIN
+    FOR parent IN
+        SELECT relname FROM pg_class
+        WHERE relkind = 'p'
+          AND relname IN ('seat_occupancy', 'pricing_model_results',
+                          'system_health', 'data_quality_log')
+    LOOP
+        PERFORM create_month_partition(parent.relname, this_month);
+        PERFORM create_month_partition(parent.relname, (this_month + INTERVAL '1 month')::date);
+
+        FOR child IN
+            SELECT c.relname
+            FROM pg_inherits i
+            JOIN pg_class c ON c.oid = i.inhrelid
+            JOIN pg_class p ON p.oid = i.inhparent
+            WHERE p.relname = parent.relname
+              AND c.relname ~ (parent.relname || '_\d{4}_\d{2}$')
+        LOOP
+            child_month := to_date(right(child.relname, 7), 'YYYY_MM');
+            IF child_month < cutoff THEN
+                EXECUTE format('DROP TABLE %I', child.relname);
+                RAISE NOTICE 'Dropped expired partition %', child.relname;
+            END IF;
+        END LOOP;
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Perform the one-time conversion of the time-series tables
+SELECT convert_to_time_partitioned('seat_occupancy', 'timestamp');
+SELECT convert_to_time_partitioned('pricing_model_results', 'calculation_timestamp');
+SELECT convert_to_time_partitioned('system_health', 'checked_at');
+SELECT convert_to_time_partitioned('data_quality_log', 'detected_at');
+
+-- Seed partitions for the current and next month
+SELECT maintain_time_partitions();
@@ -189,49 +189,43 @@ def sample_raw_data_files(temp_data_dir, sample_schedules, sample_seat_occupancy
     raw_dir = Path(temp_data_dir) / "raw"
     raw_dir.mkdir(exist_ok=True)
 
-    # Create schedule files
-    schedule_data = {
-        "schedules": [
-            {
-                "schedule_id": schedule["schedule_id"],
-                "route_id": schedule["route_id"],
-                "operator_id": schedule["operator_id"],
-                "departure_time": schedule["departure_time"].isoformat(),
-                "arrival_time": schedule["arrival_time"].isoformat(),
-                "date": schedule["date"].date().isoformat(),
-                "route_info": {
-                    "origin": "Mumbai",
-                    "destination": "Pune",
-                    "distance_km": 148.0
-                }
-            }
-            for schedule in sample_schedules
-        ]
-    }
+    # Create schedule files: flat NDJSON records, the shape the
+    # simulator emits and the ETL readers consume
+    schedule_records = [
+        {
+            "schedule_id": schedule["schedule_id"],
+            "route_id": schedule["route_id"],
+            "operator_id": schedule["operator_id"],
+            "departure_time": schedule["departure_time"].isoformat(),
+            "arrival_time": schedule["arrival_time"].isoformat(),
+            "date": schedule["date"].date().isoformat()
+        }
+        for schedule in sample_schedules
+    ]
 
     schedule_file = raw_dir / "schedules_20250615.json"
     with open(schedule_file, 'w') as f:
-        json.dump(schedule_data, f, indent=2)
+        f.writelines(json.dumps(record) + "\n"
+                     for record in schedule_records)
 
     # Create occupancy files
-    occupancy_data = {
-        "occupancy_records": [
-            {
-                "schedule_id": occ["schedule_id"],
-                "seat_type": occ["seat_type"],
-                "total_seats": occ["total_seats"],
-                "occupied_seats": occ["occupied_seats"],
-                "fare": occ["fare"],
-                "timestamp": occ["timestamp"].isoformat(),
-                "occupancy_rate": occ["occupancy_rate"]
-            }
-            for occ in sample_seat_occupancy
-        ]
-    }
+    occupancy_records = [
+        {
+            "schedule_id": occ["schedule_id"],
+            "seat_type": occ["seat_type"],
+            "total_seats": occ["total_seats"],
+            "occupied_seats": occ["occupied_seats"],
+            "fare": occ["fare"],
+            "timestamp": occ["timestamp"].isoformat(),
+            "occupancy_rate": occ["occupancy_rate"]
+        }
+        for occ in sample_seat_occupancy
+    ]
 
     occupancy_file = raw_dir / "occupancy_20250615.json"
     with open(occupancy_file, 'w') as f:
-        json.dump(occupancy_data, f, indent=2)
+        f.writelines(json.dumps(record) + "\n"
+                     for record in occupancy_records)
 
     # Create metadata files
     routes_metadata = {
@@ -293,6 +287,8 @@ def loaded_test_data(test_db_session, sample_routes, sample_operators, sample_sc
     for occupancy_data in sample_seat_occupancy:
         occupancy_data_copy = occupancy_data.copy()
         occupancy_data_copy['created_at'] = datetime.now()
+        # occupancy_rate is a generated column; the database computes it
+        occupancy_data_copy.pop('occupancy_rate', None)
         occupancy = models.SeatOccupancy(**occupancy_data_copy)
         test_db_session.add(occupancy)
 
@@ -377,55 +373,48 @@ class TestDataGenerator:
 
     @staticmethod
     def create_schedule_json(schedules, filename=None):
-        """Create a schedule JSON file"""
-        data = {
-            "schedules": [
-                {
-                    "schedule_id": s["schedule_id"],
-                    "route_id": s["route_id"],
-                    "operator_id": s["operator_id"],
-                    "departure_time": s["departure_time"].isoformat() if isinstance(s["departure_time"], datetime) else s["departure_time"],
-                    "arrival_time": s["arrival_time"].isoformat() if isinstance(s["arrival_time"], datetime) else s["arrival_time"],
-                    "date": s["date"].date().isoformat() if isinstance(s["date"], datetime) else s["date"],
-                    "route_info": s.get("route_info", {
-                        "origin": "Test Origin",
-                        "destination": "Test Destination",
-                        "distance_km": 200.0
-                    })
-                }
-                for s in schedules
-            ]
-        }
+        """Create schedule records, optionally written as an NDJSON file"""
+        records = [
+            {
+                "schedule_id": s["schedule_id"],
+                "route_id": s["route_id"],
+                "operator_id": s["operator_id"],
+                "departure_time": s["departure_time"].isoformat() if isinstance(s["departure_time"], datetime) else s["departure_time"],
+                "arrival_time": s["arrival_time"].isoformat() if isinstance(s["arrival_time"], datetime) else s["arrival_time"],
+                "date": s["date"].date().isoformat() if isinstance(s["date"], datetime) else s["date"]
+            }
+            for s in schedules
+        ]
 
         if filename:
             with open(filename, 'w') as f:
-                json.dump(data, f, indent=2)
+                f.writelines(json.dumps(record) + "\n"
+                             for record in records)
 
-        return data
+        return records
 
     @staticmethod
     def create_occupancy_json(occupancy_records, filename=None):
-        """Create an occupancy JSON file"""
-        data = {
-            "occupancy_records": [
-                {
-                    "schedule_id": o["schedule_id"],
-                    "seat_type": o["seat_type"],
-                    "total_seats": o["total_seats"],
-                    "occupied_seats": o["occupied_seats"],
-                    "fare": o["fare"],
-                    "timestamp": o["timestamp"].isoformat() if isinstance(o["timestamp"], datetime) else o["timestamp"],
-                    "occupancy_rate": o.get("occupancy_rate", o["occupied_seats"] / o["total_seats"] if o["total_seats"] > 0 else 0)
-                }
-                for o in occupancy_records
-            ]
-        }
+        """Create occupancy records, optionally written as an NDJSON file"""
+        records = [
+            {
+                "schedule_id": o["schedule_id"],
+                "seat_type": o["seat_type"],
+                "total_seats": o["total_seats"],
+                "occupied_seats": o["occupied_seats"],
+                "fare": o["fare"],
+                "timestamp": o["timestamp"].isoformat() if isinstance(o["timestamp"], datetime) else o["timestamp"],
+                "occupancy_rate": o.get("occupancy_rate", o["occupied_seats"] / o["total_seats"] if o["total_seats"] > 0 else 0)
+            }
+            for o in occupancy_records
+        ]
 
         if filename:
             with open(filename, 'w') as f:
-                json.dump(data, f, indent=2)
+                f.writelines(json.dumps(record) + "\n"
+                             for record in records)
 
-        return data
+        return records
 
 
 @pytest.fixture
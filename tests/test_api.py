@@ -193,6 +193,17 @@ class TestScheduleEndpoints:
         schedules = response.json()
         # May be empty if the test data doesn't match the date exactly
         assert isinstance(schedules, list)
+        assert "X-Total-Count" in response.headers
+        assert int(response.headers["X-Total-Count"]) >= len(schedules)
+
+    def test_get_schedules_offset_past_end(self, sample_schedule):
+        """Test that the total survives an offset past the last page"""
+        date_str = sample_schedule.date.strftime("%Y-%m-%d")
+        response = client.get(
+            f"/schedules/{sample_schedule.route_id}?date={date_str}&skip=1000")
+        assert response.status_code == 200
+        assert response.json() == []
+        assert int(response.headers["X-Total-Count"]) >= 1
 
 
 class TestAnalyticsEndpoints:
@@ -207,6 +218,23 @@ class TestAnalyticsEndpoints:
         assert stats["total_schedules"] == 0
         assert stats["average_occupancy_rate"] == 0
 
+    def test_get_occupancy_analytics_batch(self, sample_route):
+        """Test batched occupancy analytics for multiple routes"""
+        response = client.get(
+            f"/analytics/occupancy/batch?route_ids={sample_route.route_id},9999")
+        assert response.status_code == 200
+
+        stats = response.json()
+        assert len(stats) == 2
+        assert stats[0]["route_id"] == sample_route.route_id
+        assert stats[1]["route_id"] == 9999
+        assert stats[1]["total_schedules"] == 0
+
+    def test_get_occupancy_analytics_batch_invalid_ids(self):
+        """Test batched analytics rejects malformed route_ids"""
+        response = client.get("/analytics/occupancy/batch?route_ids=1,abc")
+        assert response.status_code == 422
+
     def test_get_occupancy_analytics_invalid_date(self):
         """Test occupancy analytics with invalid date"""
         response = client.get("/analytics/occupancy?date=invalid-date")
@@ -319,6 +347,34 @@ class TestAdminEndpoints:
         assert created_route["destination"] == route_data["destination"]
         assert created_route["distance_km"] == route_data["distance_km"]
 
+    def test_create_routes_bulk(self):
+        """Test creating multiple routes in one request"""
+        routes_data = [
+            {"origin": "Chennai", "destination": "Madurai", "distance_km": 462.0},
+            {"origin": "Nagpur", "destination": "Raipur", "distance_km": 290.0}
+        ]
+
+        response = client.post("/admin/routes/bulk", json=routes_data)
+        assert response.status_code == 200
+
+        created_routes = response.json()
+        assert len(created_routes) == 2
+        assert created_routes[0]["origin"] == routes_data[0]["origin"]
+        assert created_routes[1]["distance_km"] == routes_data[1]["distance_km"]
+
+    def test_create_occupancy_bulk(self, sample_schedule):
+        """Test ingesting multiple occupancy records in one request"""
+        occupancy_data = [
+            {"schedule_id": sample_schedule.schedule_id, "seat_type": "regular",
+             "total_seats": 40, "occupied_seats": 30, "fare": 450.0},
+            {"schedule_id": sample_schedule.schedule_id, "seat_type": "sleeper",
+             "total_seats": 20, "occupied_seats": 5, "fare": 900.0}
+        ]
+
+        response = client.post("/admin/occupancy/bulk", json=occupancy_data)
+        assert response.status_code == 200
+        assert response.json()["inserted"] == 2
+
     def test_create_operator(self):
         """Test creating a new operator"""
         operator_data = {
@@ -344,12 +344,7 @@ class TestETLDataProcessing:
                 "operator_id": 1,
                 "departure_time": "2025-06-15T08:00:00",
                 "arrival_time": "2025-06-15T11:30:00",
-                "date": "2025-06-15",
-                "route_info": {
-                    "origin": "Mumbai",
-                    "destination": "Pune",
-                    "distance_km": 148.0
-                }
+                "date": "2025-06-15"
             },
             {
                 "schedule_id": 1002,
@@ -357,12 +352,7 @@ class TestETLDataProcessing:
                 "operator_id": 2,
                 "departure_time": "2025-06-15T14:00:00",
                 "arrival_time": "2025-06-15T18:30:00",
-                "date": "2025-06-15",
-                "route_info": {
-                    "origin": "Delhi",
-                    "destination": "Agra",
-                    "distance_km": 206.0
-                }
+                "date": "2025-06-15"
             }
         ]
 
@@ -401,23 +391,20 @@ class TestETLDataProcessing:
         ]
 
     def test_schedule_data_structure(self, sample_schedule_data):
-        """Test schedule data has required structure"""
+        """Test schedule data has required structure
+
+        Flat records keyed by route_id; route details live in
+        routes_metadata.json, not nested in every schedule.
+        """
         for schedule in sample_schedule_data:
             required_fields = [
                 "schedule_id", "route_id", "operator_id",
-                "departure_time", "arrival_time", "date", "route_info"
+                "departure_time", "arrival_time", "date"
             ]
 
             for field in required_fields:
                 assert field in schedule
 
-            # Verify route_info structure
-            route_info = schedule["route_info"]
-            route_required_fields = ["origin", "destination", "distance_km"]
-
-            for field in route_required_fields:
-                assert field in route_info
-
     def test_occupancy_data_structure(self, sample_occupancy_data):
         """Test occupancy data has required structure"""
         for occupancy in sample_occupancy_data: